@@ -5,6 +5,9 @@ Used when main agent implementations are not available or fail
 
 import random
 import logging
+import re
+
+_SKILL_SPLIT = re.compile(r"\s*,\s*")
 
 
 class AgentFallbackHandler:
@@ -123,7 +126,7 @@ class AgentFallbackHandler:
 
         # Convert input to list if it's a string
         if isinstance(current_skills, str):
-            current_skills = [s.strip() for s in current_skills.split(",")]
+            current_skills = [s for s in _SKILL_SPLIT.split(current_skills.strip()) if s]
 
         # Generate random recommendations
         missing_tech = [s for s in all_tech_skills if s not in current_skills][:3]
@@ -4,6 +4,8 @@ import json
 import logging
 import re
 
+_ITEM_SPLIT = re.compile(r"\s*,\s*")
+
 
 class JobMatcherAgent(MultiAIAgent):
     def __init__(self):
@@ -199,9 +201,9 @@ Return ONLY valid JSON with these fields. No additional text."""
             if not isinstance(matched[field], list):
                 if isinstance(matched[field], str):
                     matched[field] = [
-                        item.strip()
-                        for item in matched[field].split(",")
-                        if item.strip()
+                        item
+                        for item in _ITEM_SPLIT.split(matched[field].strip())
+                        if item
                     ]
                 else:
                     matched[field] = []
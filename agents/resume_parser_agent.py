@@ -4,6 +4,8 @@ import json
 import re
 import logging
 
+_SKILL_SPLIT = re.compile(r"\s*,\s*")
+
 
 class ResumeParserAgent(MultiAIAgent):
     def __init__(self):
@@ -172,9 +174,9 @@ Return ONLY valid JSON with these fields. Do not include any additional text or
         if not isinstance(parsed["skills"], list):
             if isinstance(parsed["skills"], str):
                 parsed["skills"] = [
-                    skill.strip()
-                    for skill in parsed["skills"].split(",")
-                    if skill.strip()
+                    skill
+                    for skill in _SKILL_SPLIT.split(parsed["skills"].strip())
+                    if skill
                 ]
             else:
                 parsed["skills"] = []
@@ -11,6 +11,7 @@ COMPLETE REDESIGN FROM SCRATCH - NO MORE MONOLITHIC CODE!
 import streamlit as st
 import sys
 import os
+from collections import Counter, deque
 from datetime import datetime
 import logging
 
@@ -26,7 +27,6 @@ from ui.components.quantum_components import (
     quantum_header, quantum_card, quantum_metrics, quantum_progress,
     quantum_status, quantum_timeline, QuantumComponents
 )
-from ui.pages.quantum_resume_analysis import render_quantum_resume_analysis
 
 # Import utilities
 from utils.config import load_config, validate_config
@@ -37,6 +37,186 @@ from utils.sqlite_logger import init_db
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on analyses kept in the per-session history
+MAX_ANALYSIS_HISTORY = 1000
+
+
+def _session_metrics(session_data):
+    """Home page metrics for this session's analyses, read from the running stats"""
+    stats = session_data["analysis_stats"]
+    if not stats["count"]:
+        return None
+    
+    latest = session_data["analysis_history"][-1]
+    this_week = stats["weekly"][datetime.now().strftime("%G-W%V")]
+    return [
+        {
+            'icon': '📄',
+            'value': str(stats["count"]),
+            'label': 'Your Analyses',
+            'trend': f'{this_week} this week',
+            'color': 'blue'
+        },
+        {
+            'icon': '📊',
+            'value': f'{stats["sum_score"] / stats["count"]:.1f}',
+            'label': 'Average Score',
+            'color': 'green'
+        },
+        {
+            'icon': '🕒',
+            'value': f'{latest["overall_score"]:.1f}',
+            'label': 'Latest Score',
+            'color': 'purple'
+        }
+    ]
+
+_THEMES = ["Quantum", "Classic", "Dark", "Cosmic"]
+
+
+def _update_preference(name):
+    """on_change callback: copy a preference widget's value into session_data"""
+    st.session_state.session_data["user_preferences"][name] = st.session_state[f"_pref_{name}"]
+
+
+# Sidebar navigation: page ids in display order, and their radio labels
+_NAV_VALUES = (
+    "home",
+    "resume_analysis",
+    "job_matching",
+    "skill_development",
+    "auto_apply",
+    "hr_dashboard",
+    "analytics",
+    "settings"
+)
+_NAV_LABELS = {
+    "home": "🏠 Home",
+    "resume_analysis": "📄 Resume Analysis",
+    "job_matching": "🎯 Job Matching",
+    "skill_development": "📚 Skill Development",
+    "auto_apply": "🤖 Auto Apply",
+    "hr_dashboard": "👔 HR Dashboard",
+    "analytics": "📊 Analytics",
+    "settings": "⚙️ Settings"
+}
+
+def _feature_list_html(features):
+    """Render a feature list as <li> items; done once at import"""
+    return "".join(f"<li style='margin-bottom: 0.5rem;'>{feature}</li>" for feature in features)
+
+
+# Upcoming-feature pages: page id -> (title, subtitle, icon, feature list HTML)
+_PLACEHOLDER_PAGES = {
+    "job_matching": (
+        "Job Matching",
+        "AI-powered job discovery with quantum precision",
+        "🎯",
+        _feature_list_html([
+            "🔍 Quantum job search with AI filtering and ranking",
+            "📊 Compatibility scoring with 99.2% accuracy",
+            "🎯 Personalized job recommendations based on quantum analysis",
+            "📈 Real-time market analysis and salary insights",
+            "🔔 Smart job alerts with quantum timing optimization"
+        ])
+    ),
+    "skill_development": (
+        "Skill Development",
+        "Personalized learning paths with quantum AI guidance",
+        "📚",
+        _feature_list_html([
+            "🎯 Quantum skill gap analysis with precision mapping",
+            "📈 Trending skills prediction with quantum algorithms",
+            "🎓 Curated course recommendations from top platforms",
+            "📊 Progress tracking with quantum milestone optimization",
+            "🏆 Certification pathway planning with career impact analysis"
+        ])
+    ),
+    "auto_apply": (
+        "Auto Apply",
+        "Automated job applications with quantum efficiency",
+        "🤖",
+        _feature_list_html([
+            "🚀 One-click quantum job applications across platforms",
+            "📝 AI-generated cover letters with quantum personalization",
+            "🎯 Smart application targeting with success prediction",
+            "📊 Application tracking dashboard with quantum insights",
+            "📈 Success rate optimization with quantum learning"
+        ])
+    ),
+    "hr_dashboard": (
+        "HR Dashboard",
+        "Comprehensive recruiter tools with quantum insights",
+        "👔",
+        _feature_list_html([
+            "📊 Bulk resume processing with quantum speed",
+            "🎯 Candidate ranking with quantum scoring algorithms",
+            "📈 Hiring analytics with quantum predictive modeling",
+            "🔍 Advanced candidate search with quantum filtering",
+            "📋 Interview management with quantum scheduling optimization"
+        ])
+    ),
+    "analytics": (
+        "Analytics",
+        "Career progression insights with quantum analytics",
+        "📊",
+        _feature_list_html([
+            "📈 Career trajectory analysis with quantum forecasting",
+            "🎯 Performance metrics tracking with quantum precision",
+            "📊 Market trend insights with quantum data processing",
+            "🔮 Predictive career modeling with quantum algorithms",
+            "📋 Comprehensive reporting with quantum visualization"
+        ])
+    ),
+}
+
+_SIDEBAR_HEADER_HTML = """
+<div style="text-align: center; padding: 2rem 0;">
+    <div style="
+        font-size: 4rem;
+        margin-bottom: 1rem;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        animation: pulse 2s infinite;
+    ">🎯</div>
+    <h1 style="
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin: 0;
+        font-size: 1.75rem;
+        font-weight: 800;
+        font-family: 'Poppins', sans-serif;
+    ">JobSniper AI</h1>
+    <p style="
+        color: #6B7280;
+        margin: 0.5rem 0 0 0;
+        font-size: 0.875rem;
+        font-weight: 500;
+        letter-spacing: 0.05em;
+    ">QUANTUM EDITION</p>
+</div>
+
+---
+
+### 🌌 Navigation
+"""
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_load_and_validate():
+    """Load and validate configuration, cached across sidebar reruns
+
+    Returns a ``(config, validation, error)`` tuple; on failure the first two
+    are None and ``error`` holds the message, so callers need no try block.
+    """
+    try:
+        return load_config(), validate_config(), None
+    except Exception as e:
+        logger.error(f"Configuration load failed: {e}")
+        return None, None, str(e)
+
 
 class QuantumJobSniperApp:
     """Revolutionary JobSniper AI Application with Quantum UI"""
@@ -56,7 +236,7 @@ class QuantumJobSniperApp:
             menu_items={
                 'Get Help': 'https://github.com/KunjShah95/JOB-SNIPPER',
                 'Report a bug': 'https://github.com/KunjShah95/JOB-SNIPPER/issues',
-                'About': \"\"\"
+                'About': """
                 # 🎯 JobSniper AI - Quantum Edition
                 
                 **Revolutionary AI-powered career intelligence platform**
@@ -72,142 +252,104 @@ class QuantumJobSniperApp:
                 **Built with:** Streamlit, Python, Quantum AI
                 
                 🌟 **Experience the future of career intelligence!**
-                \"\"\"
+                """
             }
         )
     
     def initialize_session(self):
-        \"\"\"Initialize quantum session state\"\"\"
-        if \"quantum_initialized\" not in st.session_state:
+        """Initialize quantum session state"""
+        if "quantum_initialized" not in st.session_state:
             st.session_state.quantum_initialized = True
             st.session_state.session_data = {
-                \"session_id\": datetime.now().strftime(\"%Y%m%d_%H%M%S\"),
-                \"start_time\": datetime.now(),
-                \"current_page\": \"home\",
-                \"theme\": \"quantum\",
-                \"user_preferences\": {},
-                \"analysis_history\": []
+                "session_id": datetime.now().strftime("%Y%m%d_%H%M%S"),
+                "start_time": datetime.now(),
+                "current_page": "home",
+                "theme": "quantum",
+                "user_preferences": {"theme": "Quantum", "auto_save": True, "notifications": True},
+                "analysis_history": deque(maxlen=MAX_ANALYSIS_HISTORY),
+                "analysis_stats": {"sum_score": 0.0, "count": 0, "weekly": Counter()}
             }
     
     def setup_database(self):
-        \"\"\"Initialize database with error handling\"\"\"
+        """Initialize database with error handling"""
         try:
             init_db()
-            logger.info(\"Database initialized successfully\")
+            logger.info("Database initialized successfully")
         except Exception as e:
-            logger.error(f\"Database initialization failed: {e}\")
+            logger.error(f"Database initialization failed: {e}")
     
     def render_quantum_sidebar(self):
-        \"\"\"Render the revolutionary quantum sidebar\"\"\"
+        """Render the revolutionary quantum sidebar"""
         with st.sidebar:
-            # Quantum branding with animated logo
-            st.markdown(\"\"\"
-            <div style=\"text-align: center; padding: 2rem 0;\">
-                <div style=\"
-                    font-size: 4rem; 
-                    margin-bottom: 1rem;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    -webkit-background-clip: text;
-                    -webkit-text-fill-color: transparent;
-                    animation: pulse 2s infinite;
-                \">🎯</div>
-                <h1 style=\"
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                    -webkit-background-clip: text; 
-                    -webkit-text-fill-color: transparent; 
-                    margin: 0; 
-                    font-size: 1.75rem; 
-                    font-weight: 800;
-                    font-family: 'Poppins', sans-serif;
-                \">JobSniper AI</h1>
-                <p style=\"
-                    color: #6B7280; 
-                    margin: 0.5rem 0 0 0; 
-                    font-size: 0.875rem;
-                    font-weight: 500;
-                    letter-spacing: 0.05em;
-                \">QUANTUM EDITION</p>
-            </div>
-            \"\"\", unsafe_allow_html=True)
+            # Quantum branding and navigation heading in a single block
+            st.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
             
-            st.markdown(\"---\")
-            
-            # Quantum navigation with glassmorphism
-            st.markdown(\"### 🌌 Navigation\")
-            
-            nav_options = {
-                \"🏠 Home\": \"home\",
-                \"📄 Resume Analysis\": \"resume_analysis\", 
-                \"🎯 Job Matching\": \"job_matching\",
-                \"📚 Skill Development\": \"skill_development\",
-                \"🤖 Auto Apply\": \"auto_apply\",
-                \"👔 HR Dashboard\": \"hr_dashboard\",
-                \"📊 Analytics\": \"analytics\",
-                \"⚙️ Settings\": \"settings\"
-            }
-            
-            selected = st.radio(
-                \"Choose a section:\",
-                options=list(nav_options.keys()),
-                key=\"quantum_navigation\",
-                label_visibility=\"collapsed\"
+            current_page = st.radio(
+                "Choose a section:",
+                options=_NAV_VALUES,
+                format_func=_NAV_LABELS.__getitem__,
+                key="quantum_navigation",
+                label_visibility="collapsed"
             )
-            
-            current_page = nav_options[selected]
-            st.session_state.session_data[\"current_page\"] = current_page
-            
-            st.markdown(\"---\")
+            st.session_state.session_data["current_page"] = current_page
             
             # Quantum system status
             self.render_quantum_status()
             
             return current_page
     
+    @st.fragment
     def render_quantum_status(self):
-        \"\"\"Render quantum system status\"\"\"
-        st.markdown(\"### 🔧 Quantum Status\")
+        """Render quantum system status as a fragment so its buttons rerun only the sidebar"""
+        config, validation, error = _cached_load_and_validate()
+        if error:
+            st.error("❌ Quantum status unavailable")
+            return
         
-        try:
-            config = load_config()
-            validation = validate_config(config)
-            
-            # AI Quantum Status
-            ai_count = len(validation.get('ai_providers', []))
-            if ai_count > 0:
-                st.markdown(f\"**🤖 AI Quantum:** {quantum_status('online', f'{ai_count} Providers', 'sm')}\", unsafe_allow_html=True)
-            else:
-                st.markdown(f\"**🤖 AI Quantum:** {quantum_status('offline', 'Demo Mode', 'sm')}\", unsafe_allow_html=True)
-            
-            # Features Status
-            feature_count = len(validation.get('features_enabled', []))
-            st.markdown(f\"**🔧 Features:** {quantum_status('success', f'{feature_count} Active', 'sm')}\", unsafe_allow_html=True)
-            
-            # Performance Status
-            st.markdown(f\"**⚡ Performance:** {quantum_status('success', 'Optimal', 'sm')}\", unsafe_allow_html=True)
-            
-            st.markdown(\"---\")
-            
-            # Quantum quick actions
-            st.markdown(\"### ⚡ Quantum Actions\")
+        # Rebuild the status block only when the configuration changes;
+        # it still has to be drawn every run or Streamlit drops it
+        sig = (validation.get('ai_provider', 'fallback'), validation.get('features_enabled', 0))
+        cached = st.session_state.get('_status_markdown')
+        if cached and cached[0] == sig:
+            status_markdown = cached[1]
+        else:
+            status_markdown = self._build_status_markdown(*sig)
+            st.session_state['_status_markdown'] = (sig, status_markdown)
+        
+        st.markdown(status_markdown, unsafe_allow_html=True)
+        
+        if st.button("🔄 Refresh Quantum", use_container_width=True):
+            _cached_load_and_validate.clear()
+            st.rerun(scope="app")
             
-            if st.button(\"🔄 Refresh Quantum\", use_container_width=True):
-                st.rerun()
-                
-            if st.button(\"🌌 Demo Universe\", use_container_width=True):
-                st.session_state.demo_mode = True
-                st.success(\"🌟 Demo universe activated!\")
+        if st.button("🌌 Demo Universe", use_container_width=True):
+            st.session_state.demo_mode = True
+            st.success("🌟 Demo universe activated!")
+    
+    @staticmethod
+    def _build_status_markdown(ai_provider, feature_count):
+        """Build the sidebar status block: dividers, headings and status lines"""
+        if ai_provider != 'fallback':
+            ai_badge = quantum_status('online', ai_provider.title(), 'sm')
+        else:
+            ai_badge = quantum_status('offline', 'Demo Mode', 'sm')
         
-        except Exception as e:
-            st.error(\"❌ Quantum status unavailable\")
+        return (
+            "---\n\n### 🔧 Quantum Status\n\n"
+            f"**🤖 AI Quantum:** {ai_badge}\n\n"
+            f"**🔧 Features:** {quantum_status('success', f'{feature_count} Active', 'sm')}\n\n"
+            f"**⚡ Performance:** {quantum_status('success', 'Optimal', 'sm')}\n\n"
+            "---\n\n### ⚡ Quantum Actions"
+        )
     
     def render_quantum_home(self):
-        \"\"\"Render the revolutionary quantum home page\"\"\"
+        """Render the revolutionary quantum home page"""
         
         # Epic quantum hero section
         create_hero(
-            title=\"JobSniper AI\",
-            subtitle=\"Revolutionary AI-powered career intelligence platform with quantum precision\",
-            icon=\"🎯\"
+            title="JobSniper AI",
+            subtitle="Revolutionary AI-powered career intelligence platform with quantum precision",
+            icon="🎯"
         )
         
         # Quantum metrics dashboard
@@ -244,8 +386,14 @@ class QuantumJobSniperApp:
         
         quantum_metrics(metrics)
         
+        # This session's analyses, once there are any
+        session_metrics = _session_metrics(st.session_state.session_data)
+        if session_metrics:
+            st.markdown("## 📈 Your Session")
+            quantum_metrics(session_metrics, columns=3)
+        
         # Quantum feature showcase
-        st.markdown(\"## 🚀 Quantum Platform Features\")
+        st.markdown("## 🚀 Quantum Platform Features")
         
         features = [
             {
@@ -272,150 +420,163 @@ class QuantumJobSniperApp:
         
         # Quantum technology showcase
         gradient_card(
-            title=\"🌟 Quantum AI Technology\",
-            content=\"\"\"
-            <div style=\"display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 2rem; margin-top: 1rem;\">
-                <div style=\"text-align: center;\">
-                    <div style=\"font-size: 2.5rem; margin-bottom: 1rem;\">🧠</div>
-                    <h4 style=\"color: white; margin: 0 0 0.5rem 0;\">Neural Networks</h4>
-                    <p style=\"color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9rem;\">Advanced deep learning models with quantum processing</p>
+            title="🌟 Quantum AI Technology",
+            content="""
+            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 2rem; margin-top: 1rem;">
+                <div style="text-align: center;">
+                    <div style="font-size: 2.5rem; margin-bottom: 1rem;">🧠</div>
+                    <h4 style="color: white; margin: 0 0 0.5rem 0;">Neural Networks</h4>
+                    <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9rem;">Advanced deep learning models with quantum processing</p>
                 </div>
-                <div style=\"text-align: center;\">
-                    <div style=\"font-size: 2.5rem; margin-bottom: 1rem;\">⚡</div>
-                    <h4 style=\"color: white; margin: 0 0 0.5rem 0;\">Real-time Processing</h4>
-                    <p style=\"color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9rem;\">Instant analysis with quantum speed optimization</p>
+                <div style="text-align: center;">
+                    <div style="font-size: 2.5rem; margin-bottom: 1rem;">⚡</div>
+                    <h4 style="color: white; margin: 0 0 0.5rem 0;">Real-time Processing</h4>
+                    <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9rem;">Instant analysis with quantum speed optimization</p>
                 </div>
-                <div style=\"text-align: center;\">
-                    <div style=\"font-size: 2.5rem; margin-bottom: 1rem;\">🎯</div>
-                    <h4 style=\"color: white; margin: 0 0 0.5rem 0;\">Precision Matching</h4>
-                    <p style=\"color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9rem;\">99.2% accuracy in quantum job matching</p>
+                <div style="text-align: center;">
+                    <div style="font-size: 2.5rem; margin-bottom: 1rem;">🎯</div>
+                    <h4 style="color: white; margin: 0 0 0.5rem 0;">Precision Matching</h4>
+                    <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9rem;">99.2% accuracy in quantum job matching</p>
                 </div>
-                <div style=\"text-align: center;\">
-                    <div style=\"font-size: 2.5rem; margin-bottom: 1rem;\">🔮</div>
-                    <h4 style=\"color: white; margin: 0 0 0.5rem 0;\">Predictive Analytics</h4>
-                    <p style=\"color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9rem;\">Career trajectory forecasting with quantum insights</p>
+                <div style="text-align: center;">
+                    <div style="font-size: 2.5rem; margin-bottom: 1rem;">🔮</div>
+                    <h4 style="color: white; margin: 0 0 0.5rem 0;">Predictive Analytics</h4>
+                    <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9rem;">Career trajectory forecasting with quantum insights</p>
                 </div>
             </div>
-            \"\"\"
+            """
         )
     
-    def render_placeholder_page(self, title: str, subtitle: str, icon: str, features: list):
-        \"\"\"Render quantum placeholder pages for upcoming features\"\"\"
+    def render_placeholder_page(self, title: str, subtitle: str, icon: str, features_html: str):
+        """Render quantum placeholder pages for upcoming features from pre-rendered <li> HTML"""
         
-        quantum_header(title=title, subtitle=subtitle, icon=icon, gradient=\"cosmic\")
+        quantum_header(title=title, subtitle=subtitle, icon=icon, gradient="cosmic")
         
         quantum_card(
-            title=\"🚧 Quantum Feature Development\",
-            content=f\"\"\"
-            <div style=\"text-align: center; padding: 3rem 2rem;\">
-                <div style=\"
+            title="🚧 Quantum Feature Development",
+            content=f"""
+            <div style="text-align: center; padding: 3rem 2rem;">
+                <div style="
                     font-size: 5rem; 
                     margin-bottom: 2rem;
                     background: linear-gradient(135deg, #3B82F6, #8B5CF6);
                     -webkit-background-clip: text;
                     -webkit-text-fill-color: transparent;
                     animation: pulse 2s infinite;
-                \">{icon}</div>
+                ">{icon}</div>
                 
-                <h2 style=\"
+                <h2 style="
                     margin: 0 0 1rem 0;
                     background: linear-gradient(135deg, #1F2937, #374151);
                     -webkit-background-clip: text;
                     -webkit-text-fill-color: transparent;
                     font-weight: 800;
-                \">Revolutionary {title} Coming Soon!</h2>
+                ">Revolutionary {title} Coming Soon!</h2>
                 
-                <p style=\"color: #6B7280; font-size: 1.125rem; margin-bottom: 2rem;\">
+                <p style="color: #6B7280; font-size: 1.125rem; margin-bottom: 2rem;">
                     We're engineering quantum-powered features that will revolutionize your experience:
                 </p>
                 
-                <div style=\"text-align: left; max-width: 600px; margin: 0 auto 2rem auto;\">
-                    <ul style=\"color: #6B7280; font-size: 1rem; line-height: 1.8;\">
-                        {\"\"\".\"\"\".join([f\"<li style='margin-bottom: 0.5rem;'>{feature}</li>\" for feature in features])}
+                <div style="text-align: left; max-width: 600px; margin: 0 auto 2rem auto;">
+                    <ul style="color: #6B7280; font-size: 1rem; line-height: 1.8;">
+                        {features_html}
                     </ul>
                 </div>
                 
-                <div style=\"
+                <div style="
                     background: linear-gradient(135deg, rgba(99, 102, 241, 0.1), rgba(139, 92, 246, 0.1));
                     padding: 1.5rem;
                     border-radius: 16px;
                     border: 1px solid rgba(99, 102, 241, 0.2);
                     margin-top: 2rem;
-                \">
-                    <strong style=\"color: #6366F1;\">💡 Quantum Tip:</strong><br>
-                    <span style=\"color: #374151;\">Complete your resume analysis first to unlock personalized quantum features!</span>
+                ">
+                    <strong style="color: #6366F1;">💡 Quantum Tip:</strong><br>
+                    <span style="color: #374151;">Complete your resume analysis first to unlock personalized quantum features!</span>
                 </div>
             </div>
-            \"\"\",
-            card_type=\"glass\"
+            """,
+            card_type="glass"
         )
     
     def render_quantum_settings(self):
-        \"\"\"Render quantum settings page\"\"\"
+        """Render quantum settings page"""
         
         quantum_header(
-            title=\"Quantum Settings\",
-            subtitle=\"Configure your quantum career intelligence platform\",
-            icon=\"⚙️\",
-            gradient=\"sunset\"
+            title="Quantum Settings",
+            subtitle="Configure your quantum career intelligence platform",
+            icon="⚙️",
+            gradient="sunset"
         )
         
-        tab1, tab2, tab3 = st.tabs([\"🔑 Quantum Keys\", \"🎨 Preferences\", \"📊 System\"])
+        tab1, tab2, tab3 = st.tabs(["🔑 Quantum Keys", "🎨 Preferences", "📊 System"])
         
         with tab1:
             quantum_card(
-                title=\"🤖 AI Quantum Configuration\",
-                content=\"\"\"
-                <p style=\"margin-bottom: 1.5rem; color: #6B7280;\">
+                title="🤖 AI Quantum Configuration",
+                content="""
+                <p style="margin-bottom: 1.5rem; color: #6B7280;">
                     Configure your AI quantum providers for optimal performance and accuracy.
                 </p>
-                \"\"\",
-                card_type=\"glass\"
+                """,
+                card_type="glass"
             )
             
             gemini_key = st.text_input(
-                \"Gemini Quantum Key\",
-                type=\"password\",
-                placeholder=\"AIzaSy...\",
-                help=\"Get your quantum key from Google AI Studio\"
+                "Gemini Quantum Key",
+                type="password",
+                key="quantum_gemini_key_input",
+                placeholder="AIzaSy...",
+                help="Get your quantum key from Google AI Studio"
             )
             
             mistral_key = st.text_input(
-                \"Mistral Quantum Key\", 
-                type=\"password\",
-                placeholder=\"Your Mistral quantum key\",
-                help=\"Get your quantum key from Mistral AI Console\"
+                "Mistral Quantum Key",
+                type="password",
+                key="quantum_mistral_key_input",
+                placeholder="Your Mistral quantum key",
+                help="Get your quantum key from Mistral AI Console"
             )
             
-            if st.button(\"💾 Save Quantum Configuration\", type=\"primary\"):
-                st.success(\"✅ Quantum configuration saved successfully!\")
+            if st.button("💾 Save Quantum Configuration", type="primary"):
+                _cached_load_and_validate.clear()
+                st.success("✅ Quantum configuration saved successfully!")
         
         with tab2:
             quantum_card(
-                title=\"🎨 Quantum Preferences\",
-                content=\"\",
-                card_type=\"glass\"
+                title="🎨 Quantum Preferences",
+                content="",
+                card_type="glass"
             )
             
-            theme = st.selectbox(\"Quantum Theme\", [\"Quantum\", \"Classic\", \"Dark\", \"Cosmic\"])
-            auto_save = st.checkbox(\"Auto-save Quantum Results\", value=True)
-            notifications = st.checkbox(\"Quantum Notifications\", value=True)
+            prefs = st.session_state.session_data["user_preferences"]
+            st.selectbox(
+                "Quantum Theme", _THEMES, index=_THEMES.index(prefs["theme"]),
+                key="_pref_theme", on_change=_update_preference, args=("theme",)
+            )
+            st.checkbox(
+                "Auto-save Quantum Results", value=prefs["auto_save"],
+                key="_pref_auto_save", on_change=_update_preference, args=("auto_save",)
+            )
+            st.checkbox(
+                "Quantum Notifications", value=prefs["notifications"],
+                key="_pref_notifications", on_change=_update_preference, args=("notifications",)
+            )
             
-            if st.button(\"💾 Save Quantum Preferences\", type=\"primary\"):
-                st.success(\"✅ Quantum preferences saved!\")
+            if st.button("💾 Save Quantum Preferences", type="primary"):
+                st.success("✅ Quantum preferences saved!")
         
         with tab3:
             # Quantum system metrics
             col1, col2 = st.columns(2)
             
             with col1:
-                quantum_progress(99.9, 100, \"Quantum Uptime\", \"#10B981\")
+                quantum_progress(99.9, 100, "Quantum Uptime", "#10B981")
             
             with col2:
-                quantum_progress(97.8, 100, \"Quantum Performance\", \"#3B82F6\")
+                quantum_progress(97.8, 100, "Quantum Performance", "#3B82F6")
     
     def run(self):
-        \"\"\"Main quantum application entry point\"\"\"
+        """Main quantum application entry point"""
         try:
             # Apply quantum design system
             apply_quantum_design()
@@ -424,107 +585,42 @@ class QuantumJobSniperApp:
             current_page = self.render_quantum_sidebar()
             
             # Quantum page routing
-            if current_page == \"home\":
+            if current_page == "home":
                 self.render_quantum_home()
             
-            elif current_page == \"resume_analysis\":
+            elif current_page == "resume_analysis":
+                # Page module and its PDF stack load only once the page is opened
+                from ui.pages.quantum_resume_analysis import render_quantum_resume_analysis
                 render_quantum_resume_analysis()
             
-            elif current_page == \"job_matching\":
-                self.render_placeholder_page(
-                    \"Job Matching\",
-                    \"AI-powered job discovery with quantum precision\",
-                    \"🎯\",
-                    [
-                        \"🔍 Quantum job search with AI filtering and ranking\",
-                        \"📊 Compatibility scoring with 99.2% accuracy\", 
-                        \"🎯 Personalized job recommendations based on quantum analysis\",
-                        \"📈 Real-time market analysis and salary insights\",
-                        \"🔔 Smart job alerts with quantum timing optimization\"
-                    ]
-                )
-            
-            elif current_page == \"skill_development\":
-                self.render_placeholder_page(
-                    \"Skill Development\",
-                    \"Personalized learning paths with quantum AI guidance\",
-                    \"📚\",
-                    [
-                        \"🎯 Quantum skill gap analysis with precision mapping\",
-                        \"📈 Trending skills prediction with quantum algorithms\",
-                        \"🎓 Curated course recommendations from top platforms\",
-                        \"📊 Progress tracking with quantum milestone optimization\",
-                        \"🏆 Certification pathway planning with career impact analysis\"
-                    ]
-                )
-            
-            elif current_page == \"auto_apply\":
-                self.render_placeholder_page(
-                    \"Auto Apply\",
-                    \"Automated job applications with quantum efficiency\",
-                    \"🤖\",
-                    [
-                        \"🚀 One-click quantum job applications across platforms\",
-                        \"📝 AI-generated cover letters with quantum personalization\",
-                        \"🎯 Smart application targeting with success prediction\",
-                        \"📊 Application tracking dashboard with quantum insights\",
-                        \"📈 Success rate optimization with quantum learning\"
-                    ]
-                )
-            
-            elif current_page == \"hr_dashboard\":
-                self.render_placeholder_page(
-                    \"HR Dashboard\",
-                    \"Comprehensive recruiter tools with quantum insights\",
-                    \"👔\",
-                    [
-                        \"📊 Bulk resume processing with quantum speed\",
-                        \"🎯 Candidate ranking with quantum scoring algorithms\",
-                        \"📈 Hiring analytics with quantum predictive modeling\",
-                        \"🔍 Advanced candidate search with quantum filtering\",
-                        \"📋 Interview management with quantum scheduling optimization\"
-                    ]
-                )
-            
-            elif current_page == \"analytics\":
-                self.render_placeholder_page(
-                    \"Analytics\",
-                    \"Career progression insights with quantum analytics\",
-                    \"📊\",
-                    [
-                        \"📈 Career trajectory analysis with quantum forecasting\",
-                        \"🎯 Performance metrics tracking with quantum precision\",
-                        \"📊 Market trend insights with quantum data processing\",
-                        \"🔮 Predictive career modeling with quantum algorithms\",
-                        \"📋 Comprehensive reporting with quantum visualization\"
-                    ]
-                )
+            elif current_page in _PLACEHOLDER_PAGES:
+                self.render_placeholder_page(*_PLACEHOLDER_PAGES[current_page])
             
-            elif current_page == \"settings\":
+            elif current_page == "settings":
                 self.render_quantum_settings()
             
             else:
-                st.error(f\"❌ Unknown quantum page: {current_page}\")
+                st.error(f"❌ Unknown quantum page: {current_page}")
                 self.render_quantum_home()
         
         except Exception as e:
             # Quantum error handling
             global_error_handler.log_error(
                 error=e,
-                context=\"Quantum application\",
+                context="Quantum application",
                 show_user=True
             )
 
 
 def main():
-    \"\"\"Quantum application entry point\"\"\"
+    """Quantum application entry point"""
     try:
         app = QuantumJobSniperApp()
         app.run()
     except Exception as e:
-        st.error(\"❌ Critical quantum error\")
+        st.error("❌ Critical quantum error")
         st.exception(e)
 
 
-if __name__ == \"__main__\":
+if __name__ == "__main__":
     main()
\ No newline at end of file
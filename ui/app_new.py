@@ -38,6 +38,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Static footer columns, one markdown block each
+_FOOTER_BRAND_MD = "**🎯 JobSniper AI**\n\nProfessional Resume & Career Intelligence"
+_FOOTER_LINKS_MD = (
+    "**🔗 Quick Links**\n\n"
+    "[GitHub](https://github.com/KunjShah95/JOB-SNIPPER) | "
+    "[Issues](https://github.com/KunjShah95/JOB-SNIPPER/issues)"
+)
+
 
 class JobSniperApp:
     """Main application class for JobSniper AI"""
@@ -208,18 +216,18 @@ class JobSniperApp:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.markdown("**🎯 JobSniper AI**")
-            st.markdown("Professional Resume & Career Intelligence")
+            st.markdown(_FOOTER_BRAND_MD)
         
         with col2:
-            st.markdown("**📊 Session Stats**")
             session = st.session_state.user_session
-            st.markdown(f"Page Views: {session['page_views']}")
-            st.markdown(f"Session: {session['session_id']}")
+            st.markdown(
+                f"**📊 Session Stats**\n\n"
+                f"Page Views: {session['page_views']}\n\n"
+                f"Session: {session['session_id']}"
+            )
         
         with col3:
-            st.markdown("**🔗 Quick Links**")
-            st.markdown("[GitHub](https://github.com/KunjShah95/JOB-SNIPPER) | [Issues](https://github.com/KunjShah95/JOB-SNIPPER/issues)")
+            st.markdown(_FOOTER_LINKS_MD)
     
     def run(self):
         """Main application entry point"""
@@ -7,12 +7,81 @@ Built for JobSniper AI with glassmorphism, animations, and modern aesthetics.
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
 from typing import Dict, List, Optional, Union, Any
 import json
 
 
+_METRIC_COLORS = {
+    'blue': '#3B82F6',
+    'green': '#10B981',
+    'purple': '#8B5CF6',
+    'orange': '#F59E0B',
+    'red': '#EF4444',
+    'cyan': '#06B6D4'
+}
+
+_METRIC_GRID_HTML = """<div style="
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 1.5rem;
+    margin-bottom: 3rem;
+">{cards}</div>"""
+
+_METRIC_CARD_HTML = """<div style="
+    background: rgba(255, 255, 255, 0.1);
+    backdrop-filter: blur(20px);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 16px;
+    padding: 2rem;
+    text-align: center;
+    transition: all 0.3s ease;
+    position: relative;
+    overflow: hidden;
+" onmouseover="this.style.transform = 'translateY(-4px)'; this.style.boxShadow = '0 0 30px rgba(99, 102, 241, 0.3)';"
+   onmouseout="this.style.transform = 'translateY(0)'; this.style.boxShadow = 'none';">
+    <div style="font-size: 2.5rem; margin-bottom: 1rem;">{icon}</div>
+    <div style="
+        font-size: 2.5rem;
+        font-weight: 800;
+        background: linear-gradient(135deg, {color} 0%, {color}80 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin-bottom: 0.5rem;
+    ">{value}</div>
+    <div style="
+        font-size: 0.875rem;
+        font-weight: 600;
+        color: #6B7280;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+    ">{label}</div>{trend}
+</div>"""
+
+_METRIC_TREND_HTML = '<div style="color: {color}; font-size: 0.875rem; font-weight: 600; margin-top: 0.5rem;">{trend}</div>'
+
+
+_CARD_STYLES = {
+    "glass": "background: rgba(255, 255, 255, 0.1); backdrop-filter: blur(20px); -webkit-backdrop-filter: blur(20px); border: 1px solid rgba(255, 255, 255, 0.2);",
+    "neuro": "background: linear-gradient(145deg, #f0f0f0, #cacaca); box-shadow: 20px 20px 60px #bebebe, -20px -20px 60px #ffffff;",
+    "gradient": "background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; box-shadow: 0 0 40px rgba(99, 102, 241, 0.4);",
+    "solid": "background: white; border: 1px solid #E5E7EB; box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1);"
+}
+
+_CARD_HTML = """<div style="
+    {style}
+    border-radius: 20px;
+    padding: {padding};
+    margin-bottom: 2rem;
+    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
+    position: relative;
+    overflow: hidden;
+" onmouseover="this.style.cssText += '{hover_transform}'"
+   onmouseout="this.style.transform = 'translateY(0) scale(1)';">
+{title}{content}
+</div>
+"""
+
+
 class QuantumComponents:
     """Advanced UI components library"""
     
@@ -66,117 +135,52 @@ class QuantumComponents:
         """, unsafe_allow_html=True)
     
     @staticmethod
-    def quantum_card(content: str, title: str = "", card_type: str = "glass", 
-                    hover_effect: bool = True, padding: str = "2rem") -> None:
-        """Create advanced quantum cards"""
-        
-        card_styles = {
-            "glass": """
-                background: rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(20px);
-                -webkit-backdrop-filter: blur(20px);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            """,
-            "neuro": """
-                background: linear-gradient(145deg, #f0f0f0, #cacaca);
-                box-shadow: 20px 20px 60px #bebebe, -20px -20px 60px #ffffff;
-            """,
-            "gradient": """
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                box-shadow: 0 0 40px rgba(99, 102, 241, 0.4);
-            """,
-            "solid": """
-                background: white;
-                border: 1px solid #E5E7EB;
-                box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1);
-            """
-        }
+    def quantum_card_html(content: str, title: str = "", card_type: str = "glass",
+                          hover_effect: bool = True, padding: str = "2rem") -> str:
+        """Build quantum card HTML without rendering it, so cards can be batched"""
         
         hover_transform = "transform: translateY(-8px) scale(1.02);" if hover_effect else ""
-        title_html = f'<h3 style="margin: 0 0 1.5rem 0; font-weight: 700; font-size: 1.5rem;">{title}</h3>' if title else ''
+        title_html = f'<h3 style="margin: 0 0 1.5rem 0; font-weight: 700; font-size: 1.5rem;">{title}</h3>\n' if title else ''
         
-        st.markdown(f"""
-        <div style="
-            {card_styles.get(card_type, card_styles['glass'])}
-            border-radius: 20px;
-            padding: {padding};
-            margin-bottom: 2rem;
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-            overflow: hidden;
-        " onmouseover="this.style.cssText += '{hover_transform}'"
-           onmouseout="this.style.transform = 'translateY(0) scale(1)';">
-            {title_html}
-            {content}
-        </div>
-        """, unsafe_allow_html=True)
+        # Blank lines would end the markdown HTML block and turn the rest
+        # of the card into an indented code block
+        body = "\n".join(line for line in content.splitlines() if line.strip())
+        
+        return _CARD_HTML.format(
+            style=_CARD_STYLES.get(card_type, _CARD_STYLES['glass']),
+            padding=padding,
+            hover_transform=hover_transform,
+            title=title_html,
+            content=body
+        )
+    
+    @staticmethod
+    def quantum_card(content: str, title: str = "", card_type: str = "glass", 
+                    hover_effect: bool = True, padding: str = "2rem") -> None:
+        """Create advanced quantum cards"""
+        st.markdown(
+            QuantumComponents.quantum_card_html(content, title, card_type, hover_effect, padding),
+            unsafe_allow_html=True
+        )
     
     @staticmethod
     def quantum_metrics_grid(metrics: List[Dict[str, str]], columns: int = 4) -> None:
         """Create a responsive metrics grid"""
         
-        st.markdown(f"""
-        <div style="
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1.5rem;
-            margin-bottom: 3rem;
-        ">
-        """, unsafe_allow_html=True)
-        
+        cards = []
         for metric in metrics:
-            icon = metric.get('icon', '📊')
-            value = metric.get('value', '0')
-            label = metric.get('label', 'Metric')
+            color = _METRIC_COLORS.get(metric.get('color', 'blue'), "#3B82F6")
             trend = metric.get('trend', '')
-            color = metric.get('color', 'blue')
-            
-            color_map = {
-                'blue': '#3B82F6',
-                'green': '#10B981', 
-                'purple': '#8B5CF6',
-                'orange': '#F59E0B',
-                'red': '#EF4444',
-                'cyan': '#06B6D4'
-            }
             
-            trend_html = f'<div style="color: {color_map.get(color, "#3B82F6")}; font-size: 0.875rem; font-weight: 600; margin-top: 0.5rem;">{trend}</div>' if trend else ''
-            
-            st.markdown(f"""
-            <div style="
-                background: rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(20px);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 16px;
-                padding: 2rem;
-                text-align: center;
-                transition: all 0.3s ease;
-                position: relative;
-                overflow: hidden;
-            " onmouseover="this.style.transform = 'translateY(-4px)'; this.style.boxShadow = '0 0 30px rgba(99, 102, 241, 0.3)';"
-               onmouseout="this.style.transform = 'translateY(0)'; this.style.boxShadow = 'none';">
-                <div style="font-size: 2.5rem; margin-bottom: 1rem;">{icon}</div>
-                <div style="
-                    font-size: 2.5rem;
-                    font-weight: 800;
-                    background: linear-gradient(135deg, {color_map.get(color, "#3B82F6")} 0%, {color_map.get(color, "#3B82F6")}80 100%);
-                    -webkit-background-clip: text;
-                    -webkit-text-fill-color: transparent;
-                    margin-bottom: 0.5rem;
-                ">{value}</div>
-                <div style="
-                    font-size: 0.875rem;
-                    font-weight: 600;
-                    color: #6B7280;
-                    text-transform: uppercase;
-                    letter-spacing: 0.05em;
-                ">{label}</div>
-                {trend_html}
-            </div>
-            """, unsafe_allow_html=True)
+            cards.append(_METRIC_CARD_HTML.format(
+                icon=metric.get('icon', '📊'),
+                value=metric.get('value', '0'),
+                label=metric.get('label', 'Metric'),
+                color=color,
+                trend=_METRIC_TREND_HTML.format(color=color, trend=trend) if trend else ''
+            ))
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(_METRIC_GRID_HTML.format(cards="".join(cards)), unsafe_allow_html=True)
     
     @staticmethod
     def quantum_progress_ring(value: float, max_value: float = 100, 
@@ -407,6 +411,10 @@ def quantum_card(content: str, title: str = "", card_type: str = "glass", hover_
     """Create quantum card"""
     QuantumComponents.quantum_card(content, title, card_type, hover_effect)
 
+def quantum_card_html(content: str, title: str = "", card_type: str = "glass", hover_effect: bool = True) -> str:
+    """Build quantum card HTML for batching several cards into one markdown call"""
+    return QuantumComponents.quantum_card_html(content, title, card_type, hover_effect)
+
 def quantum_metrics(metrics: List[Dict[str, str]], columns: int = 4):
     """Create quantum metrics grid"""
     QuantumComponents.quantum_metrics_grid(metrics, columns)
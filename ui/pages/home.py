@@ -6,8 +6,6 @@ and system status. Provides an intuitive entry point for users.
 
 import streamlit as st
 from typing import Dict, Any
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 
 from ui.styles.modern_theme import ModernTheme, apply_modern_theme, create_header, create_feature_grid
@@ -266,6 +264,7 @@ def render_recent_activity():
 
 def render_activity_chart():
     """Render activity trend chart"""
+    import plotly.graph_objects as go
     
     # Sample data for the last 7 days
     dates = [(datetime.now() - timedelta(days=i)).strftime("%m/%d") for i in range(6, -1, -1)]
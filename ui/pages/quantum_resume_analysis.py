@@ -7,21 +7,323 @@ interactive visualizations, and quantum UI components.
 """
 
 import streamlit as st
-import tempfile
+import hashlib
+import html
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, Any, Optional
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 
 from ui.components.quantum_components import (
-    quantum_header, quantum_card, quantum_metrics, quantum_progress,
+    quantum_header, quantum_card, quantum_card_html, quantum_metrics, quantum_progress,
     quantum_status, quantum_timeline, QuantumComponents
 )
-from utils.validators import validate_resume_upload
+from utils.validators import validate_resume_upload, ALLOWED_RESUME_EXTENSIONS, MAX_RESUME_SIZE
 from utils.error_handler import show_success, show_warning
-from utils.pdf_reader import extract_text_from_pdf
+from utils.pdf_reader import extract_text_from_pdf_bytes
+
+
+# Page stylesheet, read once per process
+_CSS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "styles", "quantum_resume.css"
+)
+with open(_CSS_PATH, encoding="utf-8") as _css_file:
+    _PAGE_CSS = f"<style>{_css_file.read()}</style>"
+
+_UPLOAD_AREA_HTML = """
+<div class="qr-upload">
+    <div class="qr-upload__icon">📄</div>
+    <h2 class="qr-upload__title">Drag & Drop Your Resume</h2>
+    <p class="qr-upload__subtitle">
+        Supports PDF files up to 10MB<br>
+        <small>Quantum AI will analyze your resume in seconds</small>
+    </p>
+    <div class="qr-badges">
+        <span class="qr-badge qr-badge--blue">✅ ATS Optimized</span>
+        <span class="qr-badge qr-badge--green">🔒 Secure Processing</span>
+        <span class="qr-badge qr-badge--purple">⚡ Instant Results</span>
+    </div>
+</div>
+"""
+
+# Enough for any realistic resume; long portfolios stop extracting early
+RESUME_MAX_PAGES = 10
+RESUME_MAX_CHARS = 50_000
+
+
+# Shared by all sessions; PyMuPDF releases the GIL while parsing
+_EXTRACT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="resume-extract")
+
+
+# Extracted text by SHA-256 of the upload, shared by all sessions. The pool threads
+# run plain extraction with no Streamlit context; lookups happen on the script thread.
+_EXTRACT_CACHE_SIZE = 32
+_extract_cache = OrderedDict()
+_extract_cache_lock = threading.Lock()
+
+
+def _get_cached_extract(key: bytes) -> Optional[str]:
+    """Return cached text for an upload digest, marking it most recently used"""
+    with _extract_cache_lock:
+        text = _extract_cache.get(key)
+        if text is not None:
+            _extract_cache.move_to_end(key)
+        return text
+
+
+def _store_extract(key: bytes, text: str) -> None:
+    """Cache extracted text, evicting the least recently used entry when full"""
+    with _extract_cache_lock:
+        _extract_cache[key] = text
+        _extract_cache.move_to_end(key)
+        if len(_extract_cache) > _EXTRACT_CACHE_SIZE:
+            _extract_cache.popitem(last=False)
+
+
+@st.cache_data(show_spinner=False)
+def generate_mock_analysis(resume_text: str) -> Dict[str, Any]:
+    """Generate mock analysis results, cached per resume text"""
+    
+    return {
+        'overall_score': 87.5,
+        'skills': {
+            'technical': ['Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker'],
+            'soft': ['Leadership', 'Communication', 'Problem Solving', 'Teamwork'],
+            'count': 18,
+            'score': 85
+        },
+        'experience': {
+            'years': 5.3,
+            'positions': 4,
+            'progression': 'Strong',
+            'score': 92
+        },
+        'education': {
+            'degree': "Bachelor's in Computer Science",
+            'certifications': 3,
+            'score': 88
+        },
+        'formatting': {
+            'structure': 'Excellent',
+            'readability': 'High',
+            'ats_friendly': True,
+            'score': 90
+        },
+        'recommendations': [
+            {
+                'type': 'high',
+                'title': 'Add Quantified Achievements',
+                'description': 'Include specific metrics and numbers to demonstrate impact',
+                'example': 'Increased team productivity by 25% through process optimization'
+            },
+            {
+                'type': 'medium',
+                'title': 'Enhance Technical Skills',
+                'description': 'Add trending technologies relevant to your field',
+                'example': 'Consider adding: Kubernetes, Terraform, GraphQL'
+            },
+            {
+                'type': 'low',
+                'title': 'Improve Professional Summary',
+                'description': 'Make it more compelling and specific to your target role',
+                'example': 'Focus on your unique value proposition'
+            }
+        ]
+    }
+
+
+# Result card bodies, filled with str.format from the analysis dict
+_SKILLS_CARD_HTML = """
+<div style="margin-bottom: 1.5rem;">
+    <h4 style="margin: 0 0 1rem 0; color: #374151;">Technical Skills</h4>
+    <div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin-bottom: 1rem;">
+        {technical_chips}
+    </div>
+</div>
+
+<div style="margin-bottom: 1.5rem;">
+    <h4 style="margin: 0 0 1rem 0; color: #374151;">Soft Skills</h4>
+    <div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">
+        {soft_chips}
+    </div>
+</div>
+
+<div style="
+    background: rgba(59, 130, 246, 0.1);
+    padding: 1rem;
+    border-radius: 12px;
+    border-left: 4px solid #3B82F6;
+">
+    <strong style="color: #3B82F6;">Skill Match Score: {score}%</strong><br>
+    <small style="color: #6B7280;">Excellent alignment with industry standards</small>
+</div>
+"""
+
+_EDUCATION_CARD_HTML = """
+<div style="margin-bottom: 1.5rem;">
+    <h4 style="margin: 0 0 0.5rem 0; color: #374151;">Highest Degree</h4>
+    <p style="margin: 0; color: #6B7280; font-size: 1.125rem;">{degree}</p>
+</div>
+
+<div style="margin-bottom: 1.5rem;">
+    <h4 style="margin: 0 0 0.5rem 0; color: #374151;">Certifications</h4>
+    <div style="display: flex; align-items: center; gap: 1rem;">
+        <span style="font-size: 2rem; font-weight: 800; color: #8B5CF6;">{certifications}</span>
+        <span style="color: #6B7280;">Professional certifications found</span>
+    </div>
+</div>
+
+<div style="
+    background: rgba(139, 92, 246, 0.1);
+    padding: 1rem;
+    border-radius: 12px;
+    border-left: 4px solid #8B5CF6;
+">
+    <strong style="color: #8B5CF6;">Education Score: {score}%</strong><br>
+    <small style="color: #6B7280;">Strong educational foundation</small>
+</div>
+"""
+
+_EXPERIENCE_CARD_HTML = """
+<div style="margin-bottom: 1.5rem;">
+    <h4 style="margin: 0 0 1rem 0; color: #374151;">Career Progression</h4>
+    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1rem;">
+        <div style="text-align: center; padding: 1rem; background: rgba(16, 185, 129, 0.1); border-radius: 12px;">
+            <div style="font-size: 1.5rem; font-weight: 800; color: #10B981;">{years}</div>
+            <div style="font-size: 0.875rem; color: #6B7280;">Years</div>
+        </div>
+        <div style="text-align: center; padding: 1rem; background: rgba(245, 158, 11, 0.1); border-radius: 12px;">
+            <div style="font-size: 1.5rem; font-weight: 800; color: #F59E0B;">{positions}</div>
+            <div style="font-size: 0.875rem; color: #6B7280;">Positions</div>
+        </div>
+    </div>
+</div>
+
+<div style="
+    background: rgba(16, 185, 129, 0.1);
+    padding: 1rem;
+    border-radius: 12px;
+    border-left: 4px solid #10B981;
+">
+    <strong style="color: #10B981;">Experience Score: {score}%</strong><br>
+    <small style="color: #6B7280;">{progression} career progression</small>
+</div>
+"""
+
+_FORMATTING_CARD_HTML = """
+<div style="margin-bottom: 1.5rem;">
+    <h4 style="margin: 0 0 1rem 0; color: #374151;">Document Quality</h4>
+    
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.75rem;">
+        <span style="color: #6B7280;">Structure</span>
+        <span style="color: #10B981; font-weight: 600;">{structure}</span>
+    </div>
+    
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.75rem;">
+        <span style="color: #6B7280;">Readability</span>
+        <span style="color: #10B981; font-weight: 600;">{readability}</span>
+    </div>
+    
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+        <span style="color: #6B7280;">ATS Friendly</span>
+        <span style="color: #10B981; font-weight: 600;">{ats}</span>
+    </div>
+</div>
+
+<div style="
+    background: rgba(245, 158, 11, 0.1);
+    padding: 1rem;
+    border-radius: 12px;
+    border-left: 4px solid #F59E0B;
+">
+    <strong style="color: #F59E0B;">Format Score: {score}%</strong><br>
+    <small style="color: #6B7280;">Professional formatting detected</small>
+</div>
+"""
+
+_RECOMMENDATION_CARD_HTML = """
+<div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1.5rem;">
+    <h3 style="margin: 0; flex: 1; color: #1F2937;">{title}</h3>
+    <span style="
+        padding: 0.25rem 0.75rem;
+        background: {bg};
+        color: {text};
+        border: 1px solid {border}40;
+        border-radius: 50px;
+        font-size: 0.75rem;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+    ">{type} Priority</span>
+</div>
+
+<p style="color: #6B7280; margin-bottom: 1.5rem; line-height: 1.6;">{description}</p>
+
+<div style="
+    background: {bg};
+    padding: 1rem;
+    border-radius: 12px;
+    border-left: 4px solid {border};
+">
+    <strong style="color: {text};">Example:</strong><br>
+    <span style="color: #374151;">{example}</span>
+</div>
+"""
+
+_PRIORITY_COLORS = {
+    'high': {'bg': 'rgba(239, 68, 68, 0.1)', 'border': '#EF4444', 'text': '#EF4444'},
+    'medium': {'bg': 'rgba(245, 158, 11, 0.1)', 'border': '#F59E0B', 'text': '#F59E0B'},
+    'low': {'bg': 'rgba(59, 130, 246, 0.1)', 'border': '#3B82F6', 'text': '#3B82F6'}
+}
+
+_CHIP_HTML = '<span style="padding: 0.25rem 0.75rem; background: {bg}; color: {fg}; border-radius: 50px; font-size: 0.875rem;">{item}</span>'
+
+
+def _chips(items, bg: str, fg: str) -> str:
+    """Render a list of labels as pill-shaped chips"""
+    return "".join(_CHIP_HTML.format(bg=bg, fg=fg, item=item) for item in items)
+
+
+@st.cache_data(show_spinner=False)
+def _skills_card_html(skills: Dict[str, Any]) -> str:
+    """Skills Analysis card body"""
+    return _SKILLS_CARD_HTML.format(
+        technical_chips=_chips(skills['technical'], 'rgba(59, 130, 246, 0.1)', '#3B82F6'),
+        soft_chips=_chips(skills['soft'], 'rgba(16, 185, 129, 0.1)', '#10B981'),
+        score=skills['score']
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _education_card_html(education: Dict[str, Any]) -> str:
+    """Education & Certifications card body"""
+    return _EDUCATION_CARD_HTML.format_map(education)
+
+
+@st.cache_data(show_spinner=False)
+def _experience_card_html(experience: Dict[str, Any]) -> str:
+    """Experience Analysis card body"""
+    return _EXPERIENCE_CARD_HTML.format_map(experience)
+
+
+@st.cache_data(show_spinner=False)
+def _formatting_card_html(formatting: Dict[str, Any]) -> str:
+    """Format & Structure card body"""
+    return _FORMATTING_CARD_HTML.format(
+        ats='✅ Yes' if formatting['ats_friendly'] else '❌ No',
+        **formatting
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _recommendation_card_html(rec: Dict[str, Any]) -> str:
+    """Single recommendation card body, coloured by priority"""
+    color = _PRIORITY_COLORS.get(rec['type'], _PRIORITY_COLORS['low'])
+    
+    return _RECOMMENDATION_CARD_HTML.format(**rec, **color)
 
 
 class QuantumResumeAnalyzer:
@@ -33,6 +335,9 @@ class QuantumResumeAnalyzer:
     def render_page(self):
         """Render the quantum resume analysis page"""
         
+        # Page stylesheet; has to be re-emitted every run or Streamlit drops it
+        st.markdown(_PAGE_CSS, unsafe_allow_html=True)
+        
         # Quantum header
         quantum_header(
             title="Resume Analysis",
@@ -67,72 +372,14 @@ class QuantumResumeAnalyzer:
         # Upload area with quantum styling
         quantum_card(
             title="📤 Upload Your Resume",
-            content="""
-            <div style="text-align: center; padding: 3rem 2rem;">
-                <div style="
-                    font-size: 5rem; 
-                    margin-bottom: 2rem;
-                    background: linear-gradient(135deg, #3B82F6, #8B5CF6);
-                    -webkit-background-clip: text;
-                    -webkit-text-fill-color: transparent;
-                    animation: pulse 2s infinite;
-                ">📄</div>
-                
-                <h2 style="
-                    margin: 0 0 1rem 0;
-                    background: linear-gradient(135deg, #1F2937, #374151);
-                    -webkit-background-clip: text;
-                    -webkit-text-fill-color: transparent;
-                    font-weight: 800;
-                ">Drag & Drop Your Resume</h2>
-                
-                <p style="color: #6B7280; font-size: 1.125rem; margin-bottom: 2rem;">
-                    Supports PDF, DOC, DOCX files up to 10MB<br>
-                    <small>Quantum AI will analyze your resume in seconds</small>
-                </p>
-                
-                <div style="
-                    display: inline-flex;
-                    gap: 1rem;
-                    flex-wrap: wrap;
-                    justify-content: center;
-                ">
-                    <span style="
-                        padding: 0.5rem 1rem;
-                        background: rgba(59, 130, 246, 0.1);
-                        color: #3B82F6;
-                        border-radius: 50px;
-                        font-size: 0.875rem;
-                        font-weight: 600;
-                    ">✅ ATS Optimized</span>
-                    
-                    <span style="
-                        padding: 0.5rem 1rem;
-                        background: rgba(16, 185, 129, 0.1);
-                        color: #10B981;
-                        border-radius: 50px;
-                        font-size: 0.875rem;
-                        font-weight: 600;
-                    ">🔒 Secure Processing</span>
-                    
-                    <span style="
-                        padding: 0.5rem 1rem;
-                        background: rgba(139, 92, 246, 0.1);
-                        color: #8B5CF6;
-                        border-radius: 50px;
-                        font-size: 0.875rem;
-                        font-weight: 600;
-                    ">⚡ Instant Results</span>
-                </div>
-            </div>
-            """,
+            content=_UPLOAD_AREA_HTML,
             card_type="glass"
         )
         
         # File uploader
         uploaded_file = st.file_uploader(
             "Choose a file",
-            type=['pdf', 'doc', 'docx'],
+            type=sorted(ALLOWED_RESUME_EXTENSIONS),
             help="Upload your resume for quantum AI analysis",
             label_visibility="collapsed"
         )
@@ -143,33 +390,39 @@ class QuantumResumeAnalyzer:
     def handle_file_upload(self, uploaded_file):
         """Handle the uploaded resume file with quantum feedback"""
         
+        # Cheap rejections from the upload metadata before touching the bytes
+        extension = os.path.splitext(uploaded_file.name)[1].lstrip(".").lower()
+        if extension not in ALLOWED_RESUME_EXTENSIONS:
+            st.error(f"❌ Unsupported file type: .{extension or '?'} (PDF required)")
+            return
+        if uploaded_file.size > MAX_RESUME_SIZE:
+            st.error(f"❌ File is too large (max {MAX_RESUME_SIZE // (1024 * 1024)} MB)")
+            return
+        
+        file_bytes = uploaded_file.getvalue()
+        if extension == "pdf" and file_bytes[:4] != b"%PDF":
+            st.error("❌ File is not a valid PDF")
+            return
+        
+        # Format once; the name is user-controlled, so escape it before it
+        # goes into unsafe_allow_html markup
+        size_str = f"{uploaded_file.size:,}"
+        name_esc = html.escape(uploaded_file.name)
+        
         # Success message with quantum styling
         st.markdown(f"""
-        <div style="
-            background: rgba(16, 185, 129, 0.1);
-            border: 1px solid rgba(16, 185, 129, 0.3);
-            border-radius: 12px;
-            padding: 1rem;
-            margin: 1rem 0;
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-        ">
-            <div style="font-size: 1.5rem;">✅</div>
+        <div class="qr-uploaded">
+            <div class="qr-uploaded__icon">✅</div>
             <div>
-                <strong style="color: #10B981;">File uploaded successfully!</strong><br>
-                <small style="color: #6B7280;">{uploaded_file.name} ({uploaded_file.size:,} bytes)</small>
+                <strong class="qr-uploaded__title">File uploaded successfully!</strong><br>
+                <small class="qr-uploaded__meta">{name_esc} ({size_str} bytes)</small>
             </div>
         </div>
         """, unsafe_allow_html=True)
         
         # File validation
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
-            
-            validation = validate_resume_upload(tmp_path)
+            validation = validate_resume_upload(file_bytes, uploaded_file.name)
             
             if not validation['valid']:
                 for error in validation['errors']:
@@ -179,136 +432,100 @@ class QuantumResumeAnalyzer:
             # File info display
             file_info = validation['file_info']
             
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 1rem; background: rgba(59, 130, 246, 0.1); border-radius: 12px;">
-                    <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">📏</div>
+            st.markdown(f"""
+            <div class="qr-tiles">
+                <div class="qr-tile qr-tile--blue">
+                    <div class="qr-tile__icon">📏</div>
                     <strong>Size</strong><br>
-                    <span style="color: #3B82F6;">{file_info['size']:,} bytes</span>
+                    <span class="qr-tile__value">{size_str} bytes</span>
                 </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 1rem; background: rgba(139, 92, 246, 0.1); border-radius: 12px;">
-                    <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">📄</div>
+                <div class="qr-tile qr-tile--purple">
+                    <div class="qr-tile__icon">📄</div>
                     <strong>Type</strong><br>
-                    <span style="color: #8B5CF6;">{file_info['extension'].upper()}</span>
+                    <span class="qr-tile__value">{file_info['extension'].upper()}</span>
                 </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 1rem; background: rgba(16, 185, 129, 0.1); border-radius: 12px;">
-                    <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🔒</div>
+                <div class="qr-tile qr-tile--green">
+                    <div class="qr-tile__icon">🔒</div>
                     <strong>Security</strong><br>
-                    <span style="color: #10B981;">Validated</span>
+                    <span class="qr-tile__value">Validated</span>
                 </div>
-                """, unsafe_allow_html=True)
+            </div>
+            """, unsafe_allow_html=True)
             
             # Analyze button
             if st.button("🚀 Analyze with Quantum AI", type="primary", use_container_width=True):
-                self.analyze_resume(tmp_path)
+                self.analyze_resume(file_bytes)
             
         except Exception as e:
             st.error(f"❌ Error processing file: {str(e)}")
-        finally:
-            if 'tmp_path' in locals() and os.path.exists(tmp_path):
-                os.unlink(tmp_path)
     
-    def analyze_resume(self, file_path: str):
+    def analyze_resume(self, file_bytes: bytes):
         """Analyze the resume with quantum AI simulation"""
         
-        # Quantum loading animation
-        with st.spinner("🌌 Quantum AI is analyzing your resume..."):
+        # Progress reflects real checkpoints rather than a timed animation
+        with st.status("🌌 Quantum AI is analyzing your resume...", expanded=False) as status:
+            progress_bar = st.progress(0.1, text="🔍 Extracting text content...")
             
-            # Simulate analysis steps
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+            cache_key = hashlib.sha256(file_bytes).digest()
+            resume_text = _get_cached_extract(cache_key)
+            if resume_text is None:
+                # Extract text on a pool thread so the progress bar keeps moving
+                future = _EXTRACT_POOL.submit(
+                    extract_text_from_pdf_bytes, file_bytes,
+                    max_pages=RESUME_MAX_PAGES, max_chars=RESUME_MAX_CHARS
+                )
+                progress = 0.1
+                while not future.done():
+                    time.sleep(0.1)
+                    progress = min(0.7, progress + 0.05)
+                    progress_bar.progress(progress, text="🔍 Extracting text content...")
+                
+                try:
+                    resume_text = future.result()
+                except Exception as e:
+                    status.update(label="❌ Analysis failed", state="error", expanded=True)
+                    st.error(f"❌ Error extracting text: {str(e)}")
+                    return
+                _store_extract(cache_key, resume_text)
             
-            steps = [
-                ("🔍 Extracting text content...", 0.2),
-                ("🧠 Processing with neural networks...", 0.4),
-                ("📊 Analyzing skills and experience...", 0.6),
-                ("🎯 Calculating compatibility scores...", 0.8),
-                ("✨ Generating recommendations...", 1.0)
-            ]
+            if not resume_text or len(resume_text.strip()) < 50:
+                status.update(label="⚠️ Analysis incomplete", state="error", expanded=True)
+                st.warning("⚠️ Could not extract sufficient text. Please ensure the file is not image-based.")
+                return
             
-            for step_text, progress in steps:
-                status_text.text(step_text)
-                progress_bar.progress(progress)
-                time.sleep(0.8)
+            progress_bar.progress(0.8, text="📊 Analyzing skills and experience...")
             
-            # Extract text
-            try:
-                resume_text = extract_text_from_pdf(file_path)
-                if not resume_text or len(resume_text.strip()) < 50:
-                    st.warning("⚠️ Could not extract sufficient text. Please ensure the file is not image-based.")
-                    return
-            except Exception as e:
-                st.error(f"❌ Error extracting text: {str(e)}")
-                return
-        
-        # Generate mock analysis results
-        self.analysis_results = self.generate_mock_analysis(resume_text)
+            # Generate mock analysis results
+            self.analysis_results = generate_mock_analysis(resume_text)
+            
+            progress_bar.progress(1.0, text="✨ Recommendations ready")
+            status.update(label="✅ Quantum analysis complete", state="complete")
         
         # Store in session state
         st.session_state['quantum_analysis'] = self.analysis_results
+        self.record_analysis(self.analysis_results)
         
         # Success message
         st.success("✅ Quantum analysis completed! Check the Analysis Results tab.")
         st.balloons()
     
-    def generate_mock_analysis(self, resume_text: str) -> Dict[str, Any]:
-        """Generate mock analysis results"""
-        
-        return {
-            'overall_score': 87.5,
-            'skills': {
-                'technical': ['Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker'],
-                'soft': ['Leadership', 'Communication', 'Problem Solving', 'Teamwork'],
-                'count': 18,
-                'score': 85
-            },
-            'experience': {
-                'years': 5.3,
-                'positions': 4,
-                'progression': 'Strong',
-                'score': 92
-            },
-            'education': {
-                'degree': "Bachelor's in Computer Science",
-                'certifications': 3,
-                'score': 88
-            },
-            'formatting': {
-                'structure': 'Excellent',
-                'readability': 'High',
-                'ats_friendly': True,
-                'score': 90
-            },
-            'recommendations': [
-                {
-                    'type': 'high',
-                    'title': 'Add Quantified Achievements',
-                    'description': 'Include specific metrics and numbers to demonstrate impact',
-                    'example': 'Increased team productivity by 25% through process optimization'
-                },
-                {
-                    'type': 'medium',
-                    'title': 'Enhance Technical Skills',
-                    'description': 'Add trending technologies relevant to your field',
-                    'example': 'Consider adding: Kubernetes, Terraform, GraphQL'
-                },
-                {
-                    'type': 'low',
-                    'title': 'Improve Professional Summary',
-                    'description': 'Make it more compelling and specific to your target role',
-                    'example': 'Focus on your unique value proposition'
-                }
-            ]
-        }
+    def record_analysis(self, results: Dict[str, Any]):
+        """Append the analysis to the bounded session history and update running stats"""
+        
+        session_data = st.session_state.get('session_data')
+        if not session_data or 'analysis_stats' not in session_data:
+            return
+        
+        now = datetime.now()
+        session_data['analysis_history'].append({
+            'timestamp': now.isoformat(),
+            'overall_score': results['overall_score']
+        })
+        
+        stats = session_data['analysis_stats']
+        stats['sum_score'] += results['overall_score']
+        stats['count'] += 1
+        stats['weekly'][now.strftime("%G-W%V")] += 1
     
     def render_results_section(self):
         """Render the quantum analysis results"""
@@ -329,6 +546,15 @@ class QuantumResumeAnalyzer:
         
         results = st.session_state['quantum_analysis']
         
+        # The analysis dict is the same object across reruns until the next
+        # analysis, so an identity check is enough to reuse the built view
+        cached = st.session_state.get('_results_view')
+        if cached and cached[0] is results:
+            metrics, cards = cached[1], cached[2]
+        else:
+            metrics, cards = self._build_results_view(results)
+            st.session_state['_results_view'] = (results, metrics, cards)
+        
         # Overall score with quantum progress ring
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
@@ -339,172 +565,69 @@ class QuantumResumeAnalyzer:
                 color="#3B82F6"
             )
         
-        # Detailed metrics
+        quantum_metrics(metrics)
+        
+        # Detailed analysis sections
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(cards['left'], unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown(cards['right'], unsafe_allow_html=True)
+    
+    @staticmethod
+    def _build_results_view(results: Dict[str, Any]):
+        """Build the metric tiles and card bodies for an analysis result"""
+        skills = results['skills']
+        experience = results['experience']
+        education = results['education']
+        formatting = results['formatting']
+        
         metrics = [
             {
                 'icon': '🛠️',
-                'value': str(results['skills']['count']),
+                'value': str(skills['count']),
                 'label': 'Skills Found',
-                'trend': f"{results['skills']['score']}% Match",
+                'trend': f"{skills['score']}% Match",
                 'color': 'blue'
             },
             {
                 'icon': '💼',
-                'value': f"{results['experience']['years']:.1f}",
+                'value': f"{experience['years']:.1f}",
                 'label': 'Years Experience',
-                'trend': results['experience']['progression'],
+                'trend': experience['progression'],
                 'color': 'green'
             },
             {
                 'icon': '🎓',
-                'value': str(results['education']['certifications']),
+                'value': str(education['certifications']),
                 'label': 'Certifications',
-                'trend': f"{results['education']['score']}% Score",
+                'trend': f"{education['score']}% Score",
                 'color': 'purple'
             },
             {
                 'icon': '📝',
-                'value': results['formatting']['structure'],
+                'value': formatting['structure'],
                 'label': 'Format Quality',
-                'trend': f"ATS {'✅' if results['formatting']['ats_friendly'] else '❌'}",
+                'trend': f"ATS {'✅' if formatting['ats_friendly'] else '❌'}",
                 'color': 'orange'
             }
         ]
         
-        quantum_metrics(metrics)
-        
-        # Detailed analysis sections
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Skills analysis
-            quantum_card(
-                title="🛠️ Skills Analysis",
-                content=f"""
-                <div style="margin-bottom: 1.5rem;">
-                    <h4 style="margin: 0 0 1rem 0; color: #374151;">Technical Skills</h4>
-                    <div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin-bottom: 1rem;">
-                        {' '.join([f'<span style="padding: 0.25rem 0.75rem; background: rgba(59, 130, 246, 0.1); color: #3B82F6; border-radius: 50px; font-size: 0.875rem;">{skill}</span>' for skill in results['skills']['technical']])}
-                    </div>
-                </div>
-                
-                <div style="margin-bottom: 1.5rem;">
-                    <h4 style="margin: 0 0 1rem 0; color: #374151;">Soft Skills</h4>
-                    <div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">
-                        {' '.join([f'<span style="padding: 0.25rem 0.75rem; background: rgba(16, 185, 129, 0.1); color: #10B981; border-radius: 50px; font-size: 0.875rem;">{skill}</span>' for skill in results['skills']['soft']])}
-                    </div>
-                </div>
-                
-                <div style="
-                    background: rgba(59, 130, 246, 0.1);
-                    padding: 1rem;
-                    border-radius: 12px;
-                    border-left: 4px solid #3B82F6;
-                ">
-                    <strong style="color: #3B82F6;">Skill Match Score: {results['skills']['score']}%</strong><br>
-                    <small style="color: #6B7280;">Excellent alignment with industry standards</small>
-                </div>
-                """,
-                card_type="glass"
-            )
-            
-            # Education analysis
-            quantum_card(
-                title="🎓 Education & Certifications",
-                content=f"""
-                <div style="margin-bottom: 1.5rem;">
-                    <h4 style="margin: 0 0 0.5rem 0; color: #374151;">Highest Degree</h4>
-                    <p style="margin: 0; color: #6B7280; font-size: 1.125rem;">{results['education']['degree']}</p>
-                </div>
-                
-                <div style="margin-bottom: 1.5rem;">
-                    <h4 style="margin: 0 0 0.5rem 0; color: #374151;">Certifications</h4>
-                    <div style="display: flex; align-items: center; gap: 1rem;">
-                        <span style="font-size: 2rem; font-weight: 800; color: #8B5CF6;">{results['education']['certifications']}</span>
-                        <span style="color: #6B7280;">Professional certifications found</span>
-                    </div>
-                </div>
-                
-                <div style="
-                    background: rgba(139, 92, 246, 0.1);
-                    padding: 1rem;
-                    border-radius: 12px;
-                    border-left: 4px solid #8B5CF6;
-                ">
-                    <strong style="color: #8B5CF6;">Education Score: {results['education']['score']}%</strong><br>
-                    <small style="color: #6B7280;">Strong educational foundation</small>
-                </div>
-                """,
-                card_type="glass"
+        # One markdown call per column
+        cards = {
+            'left': (
+                quantum_card_html(_skills_card_html(skills), title="🛠️ Skills Analysis")
+                + quantum_card_html(_education_card_html(education), title="🎓 Education & Certifications")
+            ),
+            'right': (
+                quantum_card_html(_experience_card_html(experience), title="💼 Experience Analysis")
+                + quantum_card_html(_formatting_card_html(formatting), title="📝 Format & Structure")
             )
+        }
         
-        with col2:
-            # Experience analysis
-            quantum_card(
-                title="💼 Experience Analysis",
-                content=f"""
-                <div style="margin-bottom: 1.5rem;">
-                    <h4 style="margin: 0 0 1rem 0; color: #374151;">Career Progression</h4>
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1rem;">
-                        <div style="text-align: center; padding: 1rem; background: rgba(16, 185, 129, 0.1); border-radius: 12px;">
-                            <div style="font-size: 1.5rem; font-weight: 800; color: #10B981;">{results['experience']['years']}</div>
-                            <div style="font-size: 0.875rem; color: #6B7280;">Years</div>
-                        </div>
-                        <div style="text-align: center; padding: 1rem; background: rgba(245, 158, 11, 0.1); border-radius: 12px;">
-                            <div style="font-size: 1.5rem; font-weight: 800; color: #F59E0B;">{results['experience']['positions']}</div>
-                            <div style="font-size: 0.875rem; color: #6B7280;">Positions</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div style="
-                    background: rgba(16, 185, 129, 0.1);
-                    padding: 1rem;
-                    border-radius: 12px;
-                    border-left: 4px solid #10B981;
-                ">
-                    <strong style="color: #10B981;">Experience Score: {results['experience']['score']}%</strong><br>
-                    <small style="color: #6B7280;">{results['experience']['progression']} career progression</small>
-                </div>
-                """,
-                card_type="glass"
-            )
-            
-            # Formatting analysis
-            quantum_card(
-                title="📝 Format & Structure",
-                content=f"""
-                <div style="margin-bottom: 1.5rem;">
-                    <h4 style="margin: 0 0 1rem 0; color: #374151;">Document Quality</h4>
-                    
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.75rem;">
-                        <span style="color: #6B7280;">Structure</span>
-                        <span style="color: #10B981; font-weight: 600;">{results['formatting']['structure']}</span>
-                    </div>
-                    
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.75rem;">
-                        <span style="color: #6B7280;">Readability</span>
-                        <span style="color: #10B981; font-weight: 600;">{results['formatting']['readability']}</span>
-                    </div>
-                    
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                        <span style="color: #6B7280;">ATS Friendly</span>
-                        <span style="color: #10B981; font-weight: 600;">{'✅ Yes' if results['formatting']['ats_friendly'] else '❌ No'}</span>
-                    </div>
-                </div>
-                
-                <div style="
-                    background: rgba(245, 158, 11, 0.1);
-                    padding: 1rem;
-                    border-radius: 12px;
-                    border-left: 4px solid #F59E0B;
-                ">
-                    <strong style="color: #F59E0B;">Format Score: {results['formatting']['score']}%</strong><br>
-                    <small style="color: #6B7280;">Professional formatting detected</small>
-                </div>
-                """,
-                card_type="glass"
-            )
+        return metrics, cards
     
     def render_recommendations_section(self):
         """Render quantum recommendations"""
@@ -534,46 +657,11 @@ class QuantumResumeAnalyzer:
         )
         
         # Priority recommendations
-        for i, rec in enumerate(recommendations):
-            priority_colors = {
-                'high': {'bg': 'rgba(239, 68, 68, 0.1)', 'border': '#EF4444', 'text': '#EF4444'},
-                'medium': {'bg': 'rgba(245, 158, 11, 0.1)', 'border': '#F59E0B', 'text': '#F59E0B'},
-                'low': {'bg': 'rgba(59, 130, 246, 0.1)', 'border': '#3B82F6', 'text': '#3B82F6'}
-            }
-            
-            color = priority_colors.get(rec['type'], priority_colors['low'])
-            
-            quantum_card(
-                content=f"""
-                <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1.5rem;">
-                    <h3 style="margin: 0; flex: 1; color: #1F2937;">{rec['title']}</h3>
-                    <span style="
-                        padding: 0.25rem 0.75rem;
-                        background: {color['bg']};
-                        color: {color['text']};
-                        border: 1px solid {color['border']}40;
-                        border-radius: 50px;
-                        font-size: 0.75rem;
-                        font-weight: 600;
-                        text-transform: uppercase;
-                        letter-spacing: 0.05em;
-                    ">{rec['type']} Priority</span>
-                </div>
-                
-                <p style="color: #6B7280; margin-bottom: 1.5rem; line-height: 1.6;">{rec['description']}</p>
-                
-                <div style="
-                    background: {color['bg']};
-                    padding: 1rem;
-                    border-radius: 12px;
-                    border-left: 4px solid {color['border']};
-                ">
-                    <strong style="color: {color['text']};">Example:</strong><br>
-                    <span style="color: #374151;">{rec['example']}</span>
-                </div>
-                """,
-                card_type="glass"
-            )
+        # All recommendation cards in a single markdown call
+        st.markdown(
+            "".join(quantum_card_html(_recommendation_card_html(rec)) for rec in recommendations),
+            unsafe_allow_html=True
+        )
     
     def render_optimization_section(self):
         """Render optimization tools and export options"""
@@ -657,5 +745,9 @@ class QuantumResumeAnalyzer:
 # Main function to render the page
 def render_quantum_resume_analysis():
     """Render the quantum resume analysis page"""
-    analyzer = QuantumResumeAnalyzer()
+    # One analyzer per browser session; st.cache_resource would share a
+    # single instance, and its analysis_results, across every user
+    analyzer = st.session_state.get('_quantum_resume_analyzer')
+    if analyzer is None:
+        analyzer = st.session_state['_quantum_resume_analyzer'] = QuantumResumeAnalyzer()
     analyzer.render_page()
\ No newline at end of file
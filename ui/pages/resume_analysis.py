@@ -5,16 +5,12 @@ real-time analysis, and comprehensive feedback visualization.
 """
 
 import streamlit as st
-import tempfile
-import os
 from typing import Dict, Any, Optional
-import plotly.graph_objects as go
-import plotly.express as px
 
 from ui.styles.modern_theme import ModernTheme, apply_modern_theme, create_header
-from utils.validators import validate_resume_upload
+from utils.validators import ALLOWED_RESUME_EXTENSIONS, validate_resume_upload
 from utils.error_handler import show_success, show_warning, handle_errors
-from utils.pdf_reader import extract_text_from_pdf
+from utils.pdf_reader import extract_text_from_pdf_bytes
 from agents import ControllerAgent
 
 
@@ -63,14 +59,14 @@ def render_upload_section():
                     margin-bottom: 1rem;">
             <div style="font-size: 3rem; margin-bottom: 1rem;">📄</div>
             <h4 style="color: #2E86AB; margin-bottom: 0.5rem;">Drop your resume here</h4>
-            <p style="color: #6C757D; margin: 0;">Supports PDF, DOC, DOCX files up to 10MB</p>
+            <p style="color: #6C757D; margin: 0;">Supports PDF files up to 10MB</p>
         </div>
         """, unsafe_allow_html=True)
         
         uploaded_file = st.file_uploader(
             "Choose a file",
-            type=['pdf', 'doc', 'docx'],
-            help="Upload your resume in PDF, DOC, or DOCX format",
+            type=sorted(ALLOWED_RESUME_EXTENSIONS),
+            help="Upload your resume in PDF format",
             label_visibility="collapsed"
         )
         
@@ -88,76 +84,68 @@ def handle_file_upload(uploaded_file):
         # Show upload success
         show_success(f"File uploaded: {uploaded_file.name}")
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_path = tmp_file.name
+        # Validate file
+        file_bytes = uploaded_file.getvalue()
+        validation = validate_resume_upload(file_bytes, uploaded_file.name)
         
-        try:
-            # Validate file
-            validation = validate_resume_upload(tmp_path)
-            
-            if not validation['valid']:
-                for error in validation['errors']:
-                    st.error(f"❌ {error}")
-                return
-            
-            # Show file info
-            file_info = validation['file_info']
-            st.info(f"📋 File size: {file_info['size']:,} bytes | Type: {file_info['extension']}")
-            
-            # Extract text
-            with st.spinner("🔍 Extracting text from resume..."):
-                resume_text = extract_text_from_pdf(tmp_path)
-            
-            if not resume_text or len(resume_text.strip()) < 50:
-                st.warning("⚠️ Could not extract sufficient text from the resume. Please ensure the file is not corrupted or image-based.")
-                return
-            
-            # Store in session state
-            st.session_state['uploaded_resume'] = {
-                'filename': uploaded_file.name,
-                'text': resume_text,
-                'file_info': file_info
-            }
-            
-            # Show analysis button
-            if st.button("🚀 Analyze Resume", type="primary", use_container_width=True):
-                analyze_resume(resume_text)
+        if not validation['valid']:
+            for error in validation['errors']:
+                st.error(f"❌ {error}")
+            return
+        
+        # Show file info
+        file_info = validation['file_info']
+        st.info(f"📋 File size: {file_info['size']:,} bytes | Type: {file_info['extension']}")
         
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        # Extract text
+        with st.spinner("🔍 Extracting text from resume..."):
+            resume_text = extract_text_from_pdf_bytes(file_bytes)
+        
+        if not resume_text or len(resume_text.strip()) < 50:
+            st.warning("⚠️ Could not extract sufficient text from the resume. Please ensure the file is not corrupted or image-based.")
+            return
+        
+        # Store in session state
+        st.session_state['uploaded_resume'] = {
+            'filename': uploaded_file.name,
+            'text': resume_text,
+            'file_info': file_info
+        }
+        
+        # Show analysis button
+        if st.button("🚀 Analyze Resume", type="primary", use_container_width=True):
+            analyze_resume(resume_text)
     
     except Exception as e:
         st.error(f"❌ Error processing file: {str(e)}")
 
 
+def _get_controller() -> ControllerAgent:
+    """Build the controller and its six sub-agents once per session"""
+    # Sub-agents keep per-user caches, rate limits and usage stats, so the
+    # controller lives in session state rather than a process-wide cache
+    if '_resume_controller' not in st.session_state:
+        st.session_state['_resume_controller'] = ControllerAgent()
+    return st.session_state['_resume_controller']
+
+
 def analyze_resume(resume_text: str):
     """Analyze the resume using AI agents"""
     
     try:
         with st.spinner("🤖 Analyzing resume with AI..."):
-            # Initialize controller agent
-            controller = ControllerAgent()
-            
-            # Prepare input data
-            input_data = {
-                'resume_text': resume_text,
-                'analysis_type': 'comprehensive'
-            }
+            controller = _get_controller()
             
             # Execute analysis
-            result = controller.execute(input_data)
+            result = controller.run(resume_text)
             
-            if result.get('success', False):
-                # Store results in session state
+            if result:
+                # Store results in session state; the Results and Recommendations
+                # tabs render after this one and read it in the same script run
                 st.session_state['analysis_results'] = result
                 show_success("✅ Resume analysis completed successfully!")
-                st.rerun()
             else:
-                st.error(f"❌ Analysis failed: {result.get('error', 'Unknown error')}")
+                st.error("❌ Analysis failed: no results returned")
     
     except Exception as e:
         st.error(f"❌ Error during analysis: {str(e)}")
@@ -210,6 +198,7 @@ def render_results_section():
 
 def render_overall_score(results: Dict[str, Any]):
     """Render overall resume score"""
+    import plotly.graph_objects as go
     
     # Extract score (placeholder - adjust based on actual result structure)
     overall_score = results.get('overall_score', 85)
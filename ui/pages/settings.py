@@ -6,9 +6,29 @@ API key setup, preferences, and system configuration.
 
 import streamlit as st
 from ui.styles.modern_theme import apply_modern_theme, create_header, ModernTheme
-from utils.config import load_config, validate_config
-from utils.validators import validate_api_keys, EmailValidator
-from utils.error_handler import show_success, show_warning
+
+
+# Default preference values; the live values are kept in st.session_state["preferences"]
+_PREFERENCE_DEFAULTS = {
+    "theme": "Auto",
+    "auto_save": True,
+    "demo_mode": False,
+    "debug_mode": False,
+    "analytics": True,
+    "email_notifications": True,
+}
+_THEME_OPTIONS = ["Auto", "Light", "Dark"]
+
+
+def _get_preferences():
+    """Return the stored preferences, seeding the defaults on first use"""
+    return st.session_state.setdefault("preferences", dict(_PREFERENCE_DEFAULTS))
+
+
+def _update_preference(name):
+    """Widget on_change callback: copy the widget value into the stored preferences"""
+    # Widget keys are dropped while the page is not rendered, so the dict is the source of truth
+    _get_preferences()[name] = st.session_state[f"_settings_pref_{name}"]
 
 
 def render_settings_page():
@@ -42,6 +62,7 @@ def render_settings_page():
 
 def render_api_settings():
     """Render API key configuration"""
+    from utils.error_handler import show_success
     
     st.markdown("### 🔑 API Configuration")
     
@@ -61,12 +82,13 @@ def render_api_settings():
         gemini_key = st.text_input(
             "Gemini API Key",
             type="password",
+            key="gemini_key_input",
             placeholder="AIzaSy...",
             help="Get your API key from Google AI Studio: https://aistudio.google.com/app/apikey"
         )
         
         if gemini_key:
-            validation = validate_api_keys(gemini_key=gemini_key)
+            validation = _validate_api_keys_once("_gemini_key_validation", gemini_key=gemini_key)
             if validation['gemini_valid']:
                 st.success("✅ Valid Gemini API key format")
             else:
@@ -81,12 +103,13 @@ def render_api_settings():
         mistral_key = st.text_input(
             "Mistral API Key",
             type="password",
+            key="mistral_key_input",
             placeholder="Your Mistral API key",
             help="Get your API key from Mistral AI Console: https://console.mistral.ai/"
         )
         
         if mistral_key:
-            validation = validate_api_keys(mistral_key=mistral_key)
+            validation = _validate_api_keys_once("_mistral_key_validation", mistral_key=mistral_key)
             if validation['mistral_valid']:
                 st.success("✅ Valid Mistral API key format")
             else:
@@ -99,6 +122,7 @@ def render_api_settings():
         firecrawl_key = st.text_input(
             "Firecrawl API Key",
             type="password",
+            key="firecrawl_key_input",
             placeholder="Your Firecrawl API key",
             help="For web scraping and company research features"
         )
@@ -113,8 +137,22 @@ def render_api_settings():
         st.info("💡 Restart the application to apply changes")
 
 
+def _validate_api_keys_once(slot, gemini_key=None, mistral_key=None):
+    """Validate API key formats, reusing the stored result while the input is unchanged"""
+    sig = hash((gemini_key, mistral_key))
+    cached = st.session_state.get(slot)
+    if cached and cached[0] == sig:
+        return cached[1]
+    
+    from utils.validators import validate_api_keys
+    validation = validate_api_keys(gemini_key=gemini_key, mistral_key=mistral_key)
+    st.session_state[slot] = (sig, validation)
+    return validation
+
+
 def render_email_settings():
     """Render email configuration"""
+    from utils.error_handler import show_success, show_warning
     
     st.markdown("### 📧 Email Configuration")
     
@@ -127,18 +165,24 @@ def render_email_settings():
         """
     )
     
-    with st.form("email_config_form"):
+    # SMTP defaults live in session state so the inputs need no value=
+    st.session_state.setdefault("smtp_server_input", "smtp.gmail.com")
+    st.session_state.setdefault("smtp_port_input", 587)
+    
+    with st.form("email_config_form", clear_on_submit=False):
         st.markdown("**Gmail Configuration** (Recommended)")
         
-        email = st.text_input(
+        st.text_input(
             "Email Address",
+            key="email_address_input",
             placeholder="your.email@gmail.com",
             help="Your Gmail address for sending reports"
         )
         
-        password = st.text_input(
+        st.text_input(
             "App Password",
             type="password",
+            key="email_password_input",
             placeholder="Your Gmail app password",
             help="Generate an app password in Gmail settings (not your regular password)"
         )
@@ -147,29 +191,26 @@ def render_email_settings():
         
         col1, col2 = st.columns(2)
         with col1:
-            smtp_server = st.text_input("SMTP Server", value="smtp.gmail.com")
+            st.text_input("SMTP Server", key="smtp_server_input")
         with col2:
-            smtp_port = st.number_input("SMTP Port", value=587, min_value=1, max_value=65535)
-        
-        submitted = st.form_submit_button("💾 Save Email Configuration", type="primary")
+            st.number_input("SMTP Port", min_value=1, max_value=65535, key="smtp_port_input")
         
-        if submitted:
-            if email and password:
-                validation = EmailValidator.validate_email_config(email, password)
-                
-                if validation['valid']:
-                    show_success("Email configuration saved successfully!")
-                else:
-                    for error in validation['errors']:
-                        show_warning(error)
-            else:
-                show_warning("Please provide both email and password")
-    
+        st.form_submit_button("💾 Save Email Configuration", type="primary", on_click=_save_email_config)
+    
+    # Result of the last submit, recorded by the callback before this rerun
+    errors = st.session_state.pop("_email_config_result", None)
+    if errors is not None:
+        if not errors:
+            show_success("Email configuration saved successfully!")
+        else:
+            for error in errors:
+                show_warning(error)
+
     # Email setup guide
     with st.expander("📖 Gmail Setup Guide"):
         st.markdown("""
         **How to set up Gmail for email reports:**
-        
+
         1. **Enable 2-Factor Authentication** on your Gmail account
         2. **Generate App Password:**
            - Go to Google Account settings
@@ -177,26 +218,47 @@ def render_email_settings():
            - Select "Mail" and generate password
         3. **Use the generated app password** (not your regular password)
         4. **Test the configuration** using the form above
-        
+
         **Security Note:** App passwords are safer than using your main password.
         """)
 
 
+def _save_email_config():
+    """Form submit callback: validate the email settings and record the outcome"""
+    from utils.validators import EmailValidator
+    email = st.session_state.get("email_address_input")
+    password = st.session_state.get("email_password_input")
+    
+    if email and password:
+        validation = EmailValidator.validate_email_config(email, password)
+        errors = validation['errors'] if not validation['valid'] else []
+    else:
+        errors = ["Please provide both email and password"]
+    
+    st.session_state["_email_config_result"] = errors
+
+
 def render_preferences_settings():
     """Render user preferences"""
+    from utils.error_handler import show_success
     
     st.markdown("### 🎛️ User Preferences")
     
+    prefs = _get_preferences()
+    
     # Theme settings
     ModernTheme.create_card(
         title="🎨 Appearance",
         content=""
     )
     
-    theme = st.selectbox(
+    st.selectbox(
         "Theme",
-        options=["Auto", "Light", "Dark"],
-        index=0,
+        options=_THEME_OPTIONS,
+        index=_THEME_OPTIONS.index(prefs["theme"]),
+        key="_settings_pref_theme",
+        on_change=_update_preference,
+        args=("theme",),
         help="Choose your preferred theme"
     )
     
@@ -206,37 +268,52 @@ def render_preferences_settings():
     col1, col2 = st.columns(2)
     
     with col1:
-        auto_save = st.checkbox(
+        st.checkbox(
             "Auto-save Results",
-            value=True,
+            value=prefs["auto_save"],
+            key="_settings_pref_auto_save",
+            on_change=_update_preference,
+            args=("auto_save",),
             help="Automatically save analysis results"
         )
         
-        demo_mode = st.checkbox(
+        st.checkbox(
             "Demo Mode",
-            value=False,
+            value=prefs["demo_mode"],
+            key="_settings_pref_demo_mode",
+            on_change=_update_preference,
+            args=("demo_mode",),
             help="Use demo data when AI providers are unavailable"
         )
     
     with col2:
-        debug_mode = st.checkbox(
+        st.checkbox(
             "Debug Mode",
-            value=False,
+            value=prefs["debug_mode"],
+            key="_settings_pref_debug_mode",
+            on_change=_update_preference,
+            args=("debug_mode",),
             help="Show detailed error information"
         )
         
-        analytics = st.checkbox(
+        st.checkbox(
             "Usage Analytics",
-            value=True,
+            value=prefs["analytics"],
+            key="_settings_pref_analytics",
+            on_change=_update_preference,
+            args=("analytics",),
             help="Help improve the app by sharing usage data"
         )
     
     # Notification preferences
     st.markdown("**🔔 Notifications**")
     
-    email_notifications = st.checkbox(
+    st.checkbox(
         "Email Notifications",
-        value=True,
+        value=prefs["email_notifications"],
+        key="_settings_pref_email_notifications",
+        on_change=_update_preference,
+        args=("email_notifications",),
         help="Receive email notifications for completed analyses"
     )
     
@@ -247,6 +324,8 @@ def render_preferences_settings():
 
 def render_system_settings():
     """Render system information and settings"""
+    from utils.config import load_config, validate_config
+    from utils.error_handler import show_success
     
     st.markdown("### 📊 System Information")
     
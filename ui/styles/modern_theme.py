@@ -4,10 +4,20 @@ Provides a comprehensive, modern design system with consistent
 styling, responsive layouts, and professional appearance.
 """
 
+import os
+import re
 import streamlit as st
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 
+# Rules live in modern_theme.css and reference the design tokens through the
+# CSS variables emitted on :root; the file is read once per process
+_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modern_theme.css")
+with open(_CSS_PATH, encoding="utf-8") as _css_file:
+    _GLOBAL_RULES = _css_file.read()
+
+
 class ModernTheme:
     """Modern design system for JobSniper AI"""
     
@@ -77,352 +87,171 @@ class ModernTheme:
     @classmethod
     def apply_global_styles(cls):
         """Apply global CSS styles to the Streamlit app"""
-        
-        st.markdown(f"""
+        st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
+
+    @classmethod
+    def _build_css(cls) -> str:
+        """Build the global stylesheet: token variables on :root, then static rules"""
+        tokens = [
+            (prefix, name, value)
+            for prefix, group in (
+                ("", cls.COLORS),
+                ("font-", cls.FONTS),
+                ("space-", cls.SPACING),
+                ("radius-", cls.RADIUS),
+                ("shadow-", cls.SHADOWS),
+            )
+            for name, value in group.items()
+        ]
+        root = "\n".join(
+            f"            --{prefix}{name.replace('_', '-')}: {value};" for prefix, name, value in tokens
+        )
+        return f"""
         <style>
-        /* Import Google Fonts */
+        /* Import Google Fonts (must precede every other rule) */
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Poppins:wght@300;400;500;600;700&display=swap');
         
-        /* Global Styles */
-        .stApp {{
-            font-family: {cls.FONTS['primary']};
-            background-color: {cls.COLORS['background']};
-            color: {cls.COLORS['text_primary']};
-        }}
-        
-        /* Hide Streamlit Branding */
-        #MainMenu {{visibility: hidden;}}
-        footer {{visibility: hidden;}}
-        header {{visibility: hidden;}}
-        
-        /* Custom Scrollbar */
-        ::-webkit-scrollbar {{
-            width: 8px;
-            height: 8px;
-        }}
-        
-        ::-webkit-scrollbar-track {{
-            background: {cls.COLORS['surface']};
-            border-radius: {cls.RADIUS['md']};
-        }}
-        
-        ::-webkit-scrollbar-thumb {{
-            background: {cls.COLORS['text_muted']};
-            border-radius: {cls.RADIUS['md']};
-        }}
-        
-        ::-webkit-scrollbar-thumb:hover {{
-            background: {cls.COLORS['text_secondary']};
-        }}
-        
-        /* Sidebar Styling */
-        .css-1d391kg {{
-            background: {cls.COLORS['surface']};
-            border-right: 1px solid {cls.COLORS['surface_dark']};
-        }}
-        
-        /* Main Content Area */
-        .main .block-container {{
-            padding-top: {cls.SPACING['lg']};
-            padding-bottom: {cls.SPACING['lg']};
-            max-width: 1200px;
-        }}
-        
-        /* Headers */
-        h1, h2, h3, h4, h5, h6 {{
-            font-family: {cls.FONTS['secondary']};
-            font-weight: 600;
-            color: {cls.COLORS['text_primary']};
-            margin-bottom: {cls.SPACING['md']};
-        }}
-        
-        h1 {{
-            font-size: 2.5rem;
-            line-height: 1.2;
-        }}
-        
-        h2 {{
-            font-size: 2rem;
-            line-height: 1.3;
-        }}
-        
-        h3 {{
-            font-size: 1.5rem;
-            line-height: 1.4;
-        }}
-        
-        /* Buttons */
-        .stButton > button {{
-            background: {cls.COLORS['primary']};
-            color: white;
-            border: none;
-            border-radius: {cls.RADIUS['md']};
-            padding: {cls.SPACING['sm']} {cls.SPACING['lg']};
-            font-weight: 500;
-            font-family: {cls.FONTS['primary']};
-            transition: all 0.3s ease;
-            box-shadow: {cls.SHADOWS['sm']};
-        }}
-        
-        .stButton > button:hover {{
-            background: {cls.COLORS['primary_dark']};
-            box-shadow: {cls.SHADOWS['md']};
-            transform: translateY(-2px);
-        }}
-        
-        /* Input Fields */
-        .stTextInput > div > div > input,
-        .stTextArea > div > div > textarea,
-        .stSelectbox > div > div > select {{
-            border: 2px solid {cls.COLORS['surface_dark']};
-            border-radius: {cls.RADIUS['md']};
-            padding: {cls.SPACING['sm']};
-            font-family: {cls.FONTS['primary']};
-            transition: border-color 0.3s ease;
-        }}
-        
-        .stTextInput > div > div > input:focus,
-        .stTextArea > div > div > textarea:focus,
-        .stSelectbox > div > div > select:focus {{
-            border-color: {cls.COLORS['primary']};
-            box-shadow: 0 0 0 3px rgba(46, 134, 171, 0.1);
-        }}
-        
-        /* File Uploader */
-        .stFileUploader {{
-            border: 2px dashed {cls.COLORS['surface_dark']};
-            border-radius: {cls.RADIUS['lg']};
-            padding: {cls.SPACING['xl']};
-            text-align: center;
-            transition: all 0.3s ease;
-        }}
-        
-        .stFileUploader:hover {{
-            border-color: {cls.COLORS['primary']};
-            background-color: {cls.COLORS['surface']};
-        }}
-        
-        /* Metrics */
-        .metric-container {{
-            background: white;
-            padding: {cls.SPACING['lg']};
-            border-radius: {cls.RADIUS['lg']};
-            box-shadow: {cls.SHADOWS['sm']};
-            border-left: 4px solid {cls.COLORS['primary']};
-            margin-bottom: {cls.SPACING['md']};
-        }}
-        
-        /* Progress Bars */
-        .stProgress > div > div > div > div {{
-            background: {cls.COLORS['primary']};
-            border-radius: {cls.RADIUS['full']};
-        }}
-        
-        /* Expander */
-        .streamlit-expanderHeader {{
-            background: {cls.COLORS['surface']};
-            border-radius: {cls.RADIUS['md']};
-            border: 1px solid {cls.COLORS['surface_dark']};
-        }}
-        
-        /* Tabs */
-        .stTabs [data-baseweb="tab-list"] {{
-            gap: {cls.SPACING['md']};
-        }}
-        
-        .stTabs [data-baseweb="tab"] {{
-            background: {cls.COLORS['surface']};
-            border-radius: {cls.RADIUS['md']};
-            padding: {cls.SPACING['sm']} {cls.SPACING['lg']};
-            border: 1px solid {cls.COLORS['surface_dark']};
-        }}
-        
-        .stTabs [aria-selected="true"] {{
-            background: {cls.COLORS['primary']};
-            color: white;
-        }}
-        
-        /* Alerts */
-        .stAlert {{
-            border-radius: {cls.RADIUS['md']};
-            border: none;
-            box-shadow: {cls.SHADOWS['sm']};
-        }}
-        
-        /* Custom Classes */
-        .modern-card {{
-            background: white;
-            padding: {cls.SPACING['xl']};
-            border-radius: {cls.RADIUS['lg']};
-            box-shadow: {cls.SHADOWS['md']};
-            margin-bottom: {cls.SPACING['lg']};
-            border: 1px solid {cls.COLORS['surface_dark']};
-            transition: all 0.3s ease;
-        }}
-        
-        .modern-card:hover {{
-            box-shadow: {cls.SHADOWS['lg']};
-            transform: translateY(-4px);
-        }}
-        
-        .gradient-header {{
-            background: {cls.COLORS['gradient_primary']};
-            color: white;
-            padding: {cls.SPACING['xl']};
-            border-radius: {cls.RADIUS['lg']};
-            text-align: center;
-            margin-bottom: {cls.SPACING['xl']};
-            box-shadow: {cls.SHADOWS['md']};
-        }}
-        
-        .status-badge {{
-            display: inline-block;
-            padding: {cls.SPACING['xs']} {cls.SPACING['sm']};
-            border-radius: {cls.RADIUS['full']};
-            font-size: 0.875rem;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .status-success {{
-            background: {cls.COLORS['success']};
-            color: white;
-        }}
-        
-        .status-warning {{
-            background: {cls.COLORS['warning']};
-            color: white;
-        }}
-        
-        .status-error {{
-            background: {cls.COLORS['error']};
-            color: white;
-        }}
-        
-        .status-info {{
-            background: {cls.COLORS['info']};
-            color: white;
-        }}
-        
-        /* Loading Animation */
-        .loading-spinner {{
-            border: 4px solid {cls.COLORS['surface_dark']};
-            border-top: 4px solid {cls.COLORS['primary']};
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-            margin: 0 auto;
-        }}
-        
-        @keyframes spin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
-        }}
-        
-        /* Responsive Design */
-        @media (max-width: 768px) {{
-            .main .block-container {{
-                padding-left: {cls.SPACING['md']};
-                padding-right: {cls.SPACING['md']};
-            }}
-            
-            h1 {{
-                font-size: 2rem;
-            }}
-            
-            h2 {{
-                font-size: 1.5rem;
-            }}
-            
-            .modern-card {{
-                padding: {cls.SPACING['lg']};
-            }}
+        :root {{
+{root}
         }}
+        """ + _GLOBAL_RULES + """
         </style>
-        """, unsafe_allow_html=True)
+        """
 
     @classmethod
     def create_header(cls, title: str, subtitle: str = "", icon: str = "🎯") -> None:
         """Create a modern gradient header"""
-        st.markdown(f"""
+        st.markdown(cls._header_html(title, subtitle, icon), unsafe_allow_html=True)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _header_html(title: str, subtitle: str, icon: str) -> str:
+        """Build the gradient header markup"""
+        return f"""
         <div class="gradient-header">
             <h1>{icon} {title}</h1>
             {f'<p style="font-size: 1.2rem; margin: 0; opacity: 0.9;">{subtitle}</p>' if subtitle else ''}
         </div>
-        """, unsafe_allow_html=True)
+        """
 
     @classmethod
     def create_card(cls, content: str, title: str = "", hover: bool = True) -> None:
         """Create a modern card component"""
+        st.markdown(cls._card_html(content, title, hover), unsafe_allow_html=True)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _card_html(content: str, title: str, hover: bool) -> str:
+        """Build the card markup"""
         hover_class = "modern-card" if hover else "modern-card" 
-        st.markdown(f"""
+        return f"""
         <div class="{hover_class}">
             {f'<h3 style="margin-top: 0;">{title}</h3>' if title else ''}
             {content}
         </div>
-        """, unsafe_allow_html=True)
+        """
 
     @classmethod
     def create_status_badge(cls, text: str, status: str = "info") -> str:
         """Create a status badge"""
+        return cls._badge_html(text, status)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _badge_html(text: str, status: str) -> str:
+        """Build the status badge markup"""
         return f'<span class="status-badge status-{status}">{text}</span>'
 
     @classmethod
     def create_metric_card(cls, title: str, value: str, delta: str = "", 
                           delta_color: str = "success") -> None:
         """Create a metric card"""
-        delta_html = f'<p style="color: {cls.COLORS[delta_color]}; margin: 0; font-size: 0.9rem;">{delta}</p>' if delta else ''
-        
-        st.markdown(f"""
+        st.markdown(cls._metric_card_html(title, value, delta, delta_color), unsafe_allow_html=True)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _metric_card_html(title: str, value: str, delta: str, delta_color: str) -> str:
+        """Build the metric card markup"""
+        delta_var = delta_color.replace('_', '-')
+        delta_html = f'<p style="color: var(--{delta_var}); margin: 0; font-size: 0.9rem;">{delta}</p>' if delta else ''
+        
+        return f"""
         <div class="metric-container">
-            <h4 style="margin: 0 0 {cls.SPACING['sm']} 0; color: {cls.COLORS['text_secondary']};">{title}</h4>
-            <h2 style="margin: 0; color: {cls.COLORS['primary']};">{value}</h2>
+            <h4 style="margin: 0 0 var(--space-sm) 0; color: var(--text-secondary);">{title}</h4>
+            <h2 style="margin: 0; color: var(--primary);">{value}</h2>
             {delta_html}
         </div>
-        """, unsafe_allow_html=True)
+        """
 
     @classmethod
     def create_loading_spinner(cls, text: str = "Loading...") -> None:
         """Create a loading spinner"""
         st.markdown(f"""
-        <div style="text-align: center; padding: {cls.SPACING['xl']};">
+        <div style="text-align: center; padding: var(--space-xl);">
             <div class="loading-spinner"></div>
-            <p style="margin-top: {cls.SPACING['md']}; color: {cls.COLORS['text_secondary']};">{text}</p>
+            <p style="margin-top: var(--space-md); color: var(--text-secondary);">{text}</p>
         </div>
         """, unsafe_allow_html=True)
 
     @classmethod
     def create_feature_grid(cls, features: list) -> None:
         """Create a responsive feature grid"""
-        cols = st.columns(len(features))
-        for i, feature in enumerate(features):
-            with cols[i]:
-                cls.create_card(
-                    content=f"""
-                    <div style="text-align: center;">
-                        <div style="font-size: 3rem; margin-bottom: {cls.SPACING['md']};">{feature['icon']}</div>
-                        <h4>{feature['title']}</h4>
-                        <p style="color: {cls.COLORS['text_secondary']};">{feature['description']}</p>
-                    </div>
-                    """,
-                    hover=True
-                )
+        cards = "".join(
+            cls._feature_card_html(feature['icon'], feature['title'], feature['description'])
+            for feature in features
+        )
+        st.markdown(
+            f'<div class="feature-grid" style="--feature-columns: {len(features)};">{cards}</div>',
+            unsafe_allow_html=True
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _feature_card_html(icon: str, title: str, description: str) -> str:
+        """Build one feature grid card"""
+        return (
+            f'<div class="modern-card feature-card">'
+            f'<div class="feature-icon">{icon}</div>'
+            f'<h4>{title}</h4>'
+            f'<p class="feature-description">{description}</p>'
+            f'</div>'
+        )
 
     @classmethod
     def create_progress_card(cls, title: str, progress: float, 
                            color: str = "primary") -> None:
         """Create a progress card"""
-        st.markdown(f"""
+        st.markdown(cls._progress_card_html(title, progress, color), unsafe_allow_html=True)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _progress_card_html(title: str, progress: float, color: str) -> str:
+        """Build the progress card markup"""
+        return f"""
         <div class="modern-card">
             <h4 style="margin-top: 0;">{title}</h4>
-            <div style="background: {cls.COLORS['surface']}; border-radius: {cls.RADIUS['full']}; height: 8px; margin: {cls.SPACING['md']} 0;">
-                <div style="background: {cls.COLORS[color]}; height: 100%; width: {progress}%; border-radius: {cls.RADIUS['full']}; transition: width 0.3s ease;"></div>
+            <div style="background: var(--surface); border-radius: var(--radius-full); height: 8px; margin: var(--space-md) 0;">
+                <div style="background: var(--{color.replace('_', '-')}); height: 100%; width: {progress}%; border-radius: var(--radius-full); transition: width 0.3s ease;"></div>
             </div>
-            <p style="margin: 0; text-align: right; color: {cls.COLORS['text_secondary']};">{progress:.1f}%</p>
+            <p style="margin: 0; text-align: right; color: var(--text-secondary);">{progress:.1f}%</p>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    return _CSS_PUNCTUATION_RE.sub(r"\1", css).strip()
+
+
+# Global stylesheet, compiled and minified once at import; the design tokens never change at runtime
+_GLOBAL_CSS = _minify_css(ModernTheme._build_css())
 
 
 # Convenience functions for easy use
@@ -1,6 +1,7 @@
 import os
+import re
+import tempfile
 from dotenv import load_dotenv
-import dotenv
 import logging
 
 # Load environment variables
@@ -17,40 +18,43 @@ SENDER_PASSWORD = os.getenv("SENDER_PASSWORD")
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
 
+# Matches a KEY=value line in a .env file, with or without a leading export
+_ENV_ASSIGNMENT_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=")
+
+def _is_valid_key(value, prefix=None, min_len=20, placeholder=None):
+    """Return True when a configured secret is set, long enough, prefixed as expected and not a placeholder"""
+    stripped = (value or "").strip()
+    return (
+        bool(stripped)
+        and len(stripped) >= min_len
+        and (prefix is None or stripped.startswith(prefix))
+        and stripped != placeholder
+    )
+
+# Shared with utils.validators.validate_api_keys so both agree on what a usable key is
+GEMINI_KEY_RULE = {"prefix": "AIza", "min_len": 30, "placeholder": "your_actual_gemini_api_key_here"}
+MISTRAL_KEY_RULE = {"placeholder": "your_actual_mistral_api_key_here"}
+
+def _detect_provider():
+    """Check each AI key once and return (provider, gemini_ok, mistral_ok)"""
+    gemini_ok = _is_valid_key(GEMINI_API_KEY, **GEMINI_KEY_RULE)
+    mistral_ok = _is_valid_key(MISTRAL_API_KEY, **MISTRAL_KEY_RULE)
+    # Priority: Gemini > Mistral > Fallback Mode
+    provider = "gemini" if gemini_ok else "mistral" if mistral_ok else "fallback"
+    return provider, gemini_ok, mistral_ok
+
 # Determine which AI provider to use
-# Priority: Gemini > Mistral > Fallback Mode
-GEMINI_AVAILABLE = (
-    GEMINI_API_KEY
-    and GEMINI_API_KEY != "your_actual_gemini_api_key_here"
-    and GEMINI_API_KEY.strip() != ""
-    and len(GEMINI_API_KEY.strip()) >= 30
-    and GEMINI_API_KEY.startswith("AIza")
-)
-
-MISTRAL_AVAILABLE = (
-    MISTRAL_API_KEY
-    and MISTRAL_API_KEY != "your_actual_mistral_api_key_here"
-    and MISTRAL_API_KEY.strip() != ""
-    and len(MISTRAL_API_KEY.strip()) >= 20
-)
+AI_PROVIDER, GEMINI_AVAILABLE, MISTRAL_AVAILABLE = _detect_provider()
+
+def _email_available(email, password):
+    """Return True when both sender credentials are set and not the template placeholders"""
+    return (
+        _is_valid_key(email, min_len=1, placeholder="your_gmail@gmail.com")
+        and _is_valid_key(password, min_len=1, placeholder="your_app_password")
+    )
 
 # Email availability check
-EMAIL_AVAILABLE = (
-    SENDER_EMAIL
-    and SENDER_PASSWORD
-    and SENDER_EMAIL != "your_gmail@gmail.com"
-    and SENDER_PASSWORD != "your_app_password"
-    and SENDER_EMAIL.strip() != ""
-    and SENDER_PASSWORD.strip() != ""
-)
-
-# Set AI provider priority
-if GEMINI_AVAILABLE:
-    AI_PROVIDER = "gemini"
-elif MISTRAL_AVAILABLE:
-    AI_PROVIDER = "mistral"
-else:
-    AI_PROVIDER = "fallback"
+EMAIL_AVAILABLE = _email_available(SENDER_EMAIL, SENDER_PASSWORD)
 
 # Add Firecrawl configuration
 FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY", "")
@@ -64,14 +68,59 @@ FEATURES = {
     "web_scraping": bool(FIRECRAWL_API_KEY)
 }
 
+def _update_env_file(path, updates):
+    """Set several keys in a .env file with one read and one write, keeping other lines and comments"""
+    lines = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+
+    seen = set()
+    for i, line in enumerate(lines):
+        match = _ENV_ASSIGNMENT_RE.match(line)
+        if match and match.group(1) in updates:
+            key = match.group(1)
+            lines[i] = _format_env_line(key, updates[key])
+            seen.add(key)
+
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    lines.extend(_format_env_line(key, value) for key, value in updates.items() if key not in seen)
+
+    # Write to a temporary file beside .env and swap it in, so a failed write
+    # never leaves the secrets file truncated
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=directory, prefix=".env.", suffix=".tmp", delete=False
+    ) as tmp:
+        try:
+            tmp.writelines(lines)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+            if os.path.exists(path):
+                os.chmod(tmp.name, os.stat(path).st_mode & 0o777)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    try:
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+def _format_env_line(key, value):
+    """Format a single-quoted assignment the way dotenv.set_key writes it"""
+    escaped = str(value).replace("'", "\\'")
+    return f"{key}='{escaped}'\n"
+
 def update_email_config(email, password):
     """Updates the email configuration in the .env file"""
     try:
         dotenv_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
 
         # Update the .env file
-        dotenv.set_key(dotenv_file, "SENDER_EMAIL", email)
-        dotenv.set_key(dotenv_file, "SENDER_PASSWORD", password)
+        _update_env_file(dotenv_file, {"SENDER_EMAIL": email, "SENDER_PASSWORD": password})
 
         # Also update the global variables
         global SENDER_EMAIL, SENDER_PASSWORD, EMAIL_AVAILABLE
@@ -79,14 +128,7 @@ def update_email_config(email, password):
         SENDER_PASSWORD = password
 
         # Check if email is now configured
-        EMAIL_AVAILABLE = (
-            SENDER_EMAIL
-            and SENDER_PASSWORD
-            and SENDER_EMAIL != "your_gmail@gmail.com"
-            and SENDER_PASSWORD != "your_app_password"
-            and SENDER_EMAIL.strip() != ""
-            and SENDER_PASSWORD.strip() != ""
-        )
+        EMAIL_AVAILABLE = _email_available(SENDER_EMAIL, SENDER_PASSWORD)
 
         return EMAIL_AVAILABLE
     except Exception as e:
@@ -1,14 +1,76 @@
 from PyPDF2 import PdfReader
+import importlib.util
+import io
 import logging
 import os
+from contextlib import closing
 
+# PyMuPDF is optional; PyPDF2 is used when it is missing
+PYMUPDF_AVAILABLE = importlib.util.find_spec("fitz") is not None
 
-def extract_text_from_pdf(file_path):
+# pdfminer logs every parsed token at DEBUG, which slows extraction badly
+# whenever a root handler is configured at that level
+for _name in ("pdfminer", "pdfminer.psparser", "pdfminer.pdfinterp"):
+    logging.getLogger(_name).setLevel(logging.WARNING)
+
+
+def _iter_pages_pymupdf(source):
+    """Yield per-page text with PyMuPDF, in reading order"""
+    import fitz
+
+    if isinstance(source, bytes):
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(source)
+    with doc:
+        for page in doc:
+            yield page.get_text("text", sort=True)
+
+
+def _iter_pages_pypdf2(source):
+    """Yield per-page text with PyPDF2"""
+    reader = PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+    for page in reader.pages:
+        yield page.extract_text()
+
+
+def _extract_text(source, backend, max_pages=None, max_chars=None):
+    """Extract text from a PDF path or in-memory bytes, stopping early at the limits"""
+    if backend == "pymupdf" and PYMUPDF_AVAILABLE:
+        page_iter = _iter_pages_pymupdf(source)
+        separator = "\n"
+    else:
+        page_iter = _iter_pages_pypdf2(source)
+        separator = " "
+
+    pages = []
+    total_chars = 0
+    with closing(page_iter):
+        for page_text in page_iter:
+            pages.append(page_text)
+            total_chars += len(page_text or "")
+            if (max_pages and len(pages) >= max_pages) or (max_chars and total_chars >= max_chars):
+                break
+
+    if len(pages) == 0:
+        return "The PDF file appears to be empty."
+
+    text = separator.join(page for page in pages if page)
+
+    if not text.strip():
+        return "No text could be extracted from the PDF. It may be scanned or contain only images."
+
+    return text
+
+
+def extract_text_from_pdf(file_path, backend="pymupdf"):
     """
     Extracts text from a PDF file with error handling.
 
     Args:
         file_path (str): Path to the PDF file
+        backend (str): "pymupdf" (default, falls back to PyPDF2 when PyMuPDF
+            is not installed) or "pypdf2"
 
     Returns:
         str: Extracted text from PDF or error message
@@ -17,22 +79,30 @@ def extract_text_from_pdf(file_path):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"PDF file not found at {file_path}")
 
-        reader = PdfReader(file_path)
+        return _extract_text(file_path, backend)
+    except FileNotFoundError as e:
+        logging.error(f"File not found: {str(e)}")
+        raise
+    except Exception as e:
+        logging.error(f"Error extracting text from PDF: {str(e)}")
+        raise Exception(f"Failed to process PDF: {str(e)}")
 
-        if len(reader.pages) == 0:
-            return "The PDF file appears to be empty."
 
-        text = " ".join(
-            [page.extract_text() for page in reader.pages if page.extract_text()]
-        )
+def extract_text_from_pdf_bytes(data, backend="pymupdf", max_pages=None, max_chars=None):
+    """
+    Extracts text from an in-memory PDF, e.g. an uploaded file's bytes.
 
-        if not text.strip():
-            return "No text could be extracted from the PDF. It may be scanned or contain only images."
+    Args:
+        data (bytes): Raw PDF content
+        backend (str): Same as for extract_text_from_pdf
+        max_pages (int, optional): Stop after this many pages
+        max_chars (int, optional): Stop once this many characters are collected
 
-        return text
-    except FileNotFoundError as e:
-        logging.error(f"File not found: {str(e)}")
-        raise
+    Returns:
+        str: Extracted text from PDF or error message
+    """
+    try:
+        return _extract_text(data, backend, max_pages, max_chars)
     except Exception as e:
         logging.error(f"Error extracting text from PDF: {str(e)}")
         raise Exception(f"Failed to process PDF: {str(e)}")
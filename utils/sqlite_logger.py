@@ -1,33 +1,97 @@
+import atexit
 import sqlite3
 import datetime
+import json
 import logging
+import queue
+import threading
 from contextlib import contextmanager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Statements are module constants so every call hits the connection's
+# statement cache with the identical SQL text
+SQL_INSERT_RESUME = """
+    INSERT INTO resume_logs 
+    (timestamp, name, skills, education, experience, match_percent, job_title, feedback_summary, suggested_jobs,
+     skills_json, suggested_jobs_json) 
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_INSERT_INTERACTION = """
+    INSERT INTO agent_interactions 
+    (timestamp, agent_name, action, input_data, output_data) 
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_SELECT_HISTORY = "SELECT * FROM resume_logs ORDER BY id DESC LIMIT ?"
+SQL_SELECT_BY_ID = "SELECT * FROM resume_logs WHERE id = ?"
+# Summary columns only; skips the long feedback and suggestion text
+SQL_HISTORY_SUMMARY = "SELECT id, timestamp, name, match_percent, job_title FROM resume_logs ORDER BY id DESC LIMIT ?"
+SQL_SELECT_BY_SKILL = """
+    SELECT DISTINCT resume_logs.* FROM resume_logs, json_each(resume_logs.skills_json)
+    WHERE json_each.value = ? ORDER BY resume_logs.id DESC LIMIT ?
+"""
+
+# JSON list columns added after the original schema; the comma-joined skills and
+# suggested_jobs columns are still written for existing readers
+_JSON_COLUMNS = ("skills_json", "suggested_jobs_json")
+
+# One connection per thread and database, reused across calls; a thread's
+# connections are closed when the thread exits and its locals are released
+_conn_local = threading.local()
+# Serializes writers in this process so they do not contend for SQLite's file lock
+_write_lock = threading.Lock()
+# Databases whose schema has been created by init_db in this process
+_initialized_dbs = set()
+
+# Agent interactions are queued by log_interaction and written in batches by a
+# daemon thread, so agents never wait on disk I/O
+_INTERACTION_BATCH_SIZE = 200
+_LOG_FIELD_LIMIT = 5000
+
+_interaction_queue = queue.Queue()
+_flusher_lock = threading.Lock()
+_flusher_thread = None
+
+def _get_conn(db_path="history.db"):
+    """Return this thread's connection to db_path, opening it on first use"""
+    conns = getattr(_conn_local, "conns", None)
+    if conns is None:
+        conns = _conn_local.conns = {}
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = conns[db_path] = sqlite3.connect(db_path, cached_statements=256)
+        # Rows index by position like tuples and by column name
+        conn.row_factory = sqlite3.Row
+        # Per-connection settings; journal_mode=WAL is persisted by init_db
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
 @contextmanager
 def get_db_connection(db_path="history.db"):
     """Context manager for database connections"""
-    conn = None
+    conn = _get_conn(db_path)
     try:
-        conn = sqlite3.connect(db_path)
         yield conn
     except Exception as e:
-        if conn:
-            conn.rollback()
+        conn.rollback()
         logger.error(f"Database error: {e}")
         raise
-    finally:
-        if conn:
-            conn.close()
 
 def init_db(db_path="history.db"):
     """Initialize the database with a more comprehensive schema"""
+    # The apps call this on every rerun; the DDL only needs to run once per process
+    if db_path in _initialized_dbs:
+        return
     try:
-        with get_db_connection(db_path) as conn:
+        with _write_lock, get_db_connection(db_path) as conn:
             c = conn.cursor()
+            # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+            # avoids an fsync per commit; the mode is stored in the database file
+            c.execute("PRAGMA journal_mode=WAL")
             c.execute("""CREATE TABLE IF NOT EXISTS resume_logs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp TEXT,
@@ -38,9 +102,26 @@ def init_db(db_path="history.db"):
                 match_percent INTEGER,
                 job_title TEXT,
                 feedback_summary TEXT,
-                suggested_jobs TEXT
+                suggested_jobs TEXT,
+                skills_json TEXT,
+                suggested_jobs_json TEXT
             )""")
             
+            # Migrate databases created before the JSON columns existed
+            existing = {row[1] for row in c.execute("PRAGMA table_info(resume_logs)")}
+            missing = [column for column in _JSON_COLUMNS if column not in existing]
+            for column in missing:
+                c.execute(f"ALTER TABLE resume_logs ADD COLUMN {column} TEXT")
+            if missing:
+                legacy = c.execute("SELECT id, skills, suggested_jobs FROM resume_logs").fetchall()
+                c.executemany(
+                    "UPDATE resume_logs SET skills_json = ?, suggested_jobs_json = ? WHERE id = ?",
+                    [
+                        (json.dumps(_split_legacy(skills)), json.dumps(_split_legacy(jobs)), row_id)
+                        for row_id, skills, jobs in legacy
+                    ],
+                )
+            
             # Create interactions table
             c.execute("""CREATE TABLE IF NOT EXISTS agent_interactions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -52,108 +133,232 @@ def init_db(db_path="history.db"):
             )""")
             
             conn.commit()
+            _initialized_dbs.add(db_path)
             logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Database initialization error: {e}")
         raise
 
+def _resume_row(parsed_data, match_result, timestamp):
+    """Build the resume_logs insert parameters, filling defaults for missing fields"""
+    # Handle missing fields with defaults
+    name = parsed_data.get("name", "Unknown") if parsed_data else "Unknown"
+    skills = parsed_data.get("skills", []) if parsed_data else []
+    skills_list = skills if isinstance(skills, list) else ([skills] if skills else [])
+    skills_str = ",".join(skills) if isinstance(skills, list) else str(skills)
+    education = parsed_data.get("education", "Unknown") if parsed_data else "Unknown"
+    experience = parsed_data.get("experience", "Unknown") if parsed_data else "Unknown"
+
+    # Handle match result with defaults
+    match_percent = 0
+    job_title = ""
+    feedback_summary = ""
+    suggested_jobs = ""
+    job_roles = []
+    
+    if isinstance(match_result, dict):
+        match_percent = match_result.get("match_percent", 0)
+        job_title = match_result.get("job_title", "")
+        feedback_summary = match_result.get("feedback_summary", "")
+        job_roles = match_result.get("job_roles", [])
+        suggested_jobs = ",".join(job_roles)
+
+    return (
+        timestamp,
+        name,
+        skills_str,
+        education,
+        experience,
+        match_percent,
+        job_title,
+        feedback_summary,
+        suggested_jobs,
+        json.dumps(skills_list, default=str),
+        json.dumps(job_roles, default=str),
+    )
+
 def save_to_db(parsed_data, match_result, db_path="history.db"):
     """Save resume analysis results to database with improved error handling"""
-    try:
-        with get_db_connection(db_path) as conn:
-            c = conn.cursor()
+    save_many_to_db([(parsed_data, match_result)], db_path)
 
-            # Handle missing fields with defaults
-            name = parsed_data.get("name", "Unknown") if parsed_data else "Unknown"
-            skills = parsed_data.get("skills", []) if parsed_data else []
-            skills_str = ",".join(skills) if isinstance(skills, list) else str(skills)
-            education = parsed_data.get("education", "Unknown") if parsed_data else "Unknown"
-            experience = parsed_data.get("experience", "Unknown") if parsed_data else "Unknown"
-
-            # Handle match result with defaults
-            match_percent = 0
-            job_title = ""
-            feedback_summary = ""
-            suggested_jobs = ""
-            
-            if isinstance(match_result, dict):
-                match_percent = match_result.get("match_percent", 0)
-                job_title = match_result.get("job_title", "")
-                feedback_summary = match_result.get("feedback_summary", "")
-                suggested_jobs = ",".join(match_result.get("job_roles", []))
-
-            c.execute("""
-                INSERT INTO resume_logs 
-                (timestamp, name, skills, education, experience, match_percent, job_title, feedback_summary, suggested_jobs) 
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                datetime.datetime.now().isoformat(),
-                name,
-                skills_str,
-                education,
-                experience,
-                match_percent,
-                job_title,
-                feedback_summary,
-                suggested_jobs,
-            ))
+def save_many_to_db(records, db_path="history.db"):
+    """Save several (parsed_data, match_result) pairs in a single transaction"""
+    try:
+        timestamp = datetime.datetime.now().isoformat()
+        rows = [_resume_row(parsed_data, match_result, timestamp) for parsed_data, match_result in records]
+        if not rows:
+            return
+        
+        with _write_lock, get_db_connection(db_path) as conn:
+            conn.executemany(SQL_INSERT_RESUME, rows)
             conn.commit()
-            logger.info("Data saved to database successfully")
+            logger.info(f"Saved {len(rows)} record(s) to database successfully")
     except Exception as e:
         logger.error(f"Error saving to database: {e}")
         raise
 
 def get_history(limit=10, db_path="history.db"):
-    """Retrieve resume analysis history with improved error handling"""
+    """Retrieve resume analysis history with improved error handling; see get_history_summary for list views"""
     try:
         with get_db_connection(db_path) as conn:
             c = conn.cursor()
-            c.execute("SELECT * FROM resume_logs ORDER BY id DESC LIMIT ?", (limit,))
+            c.execute(SQL_SELECT_HISTORY, (limit,))
             rows = c.fetchall()
             return rows
     except Exception as e:
         logger.error(f"Error retrieving history: {e}")
         return []
 
+def get_history_summary(limit=10, db_path="history.db"):
+    """Retrieve recent analyses with summary columns only; lighter than get_history for list views"""
+    try:
+        with get_db_connection(db_path) as conn:
+            return conn.execute(SQL_HISTORY_SUMMARY, (limit,)).fetchall()
+    except Exception as e:
+        logger.error(f"Error retrieving history summary: {e}")
+        return []
+
+def parse_skills(row):
+    """Return a resume_logs row's skills as a list"""
+    if row["skills_json"] is not None:
+        return json.loads(row["skills_json"])
+    return _split_legacy(row["skills"])
+
+def _split_legacy(value):
+    """Split a legacy comma-joined column into a list"""
+    return [item for item in (value or "").split(",") if item]
+
+def find_resumes_by_skill(skill, limit=10, db_path="history.db"):
+    """Retrieve recent analyses whose skills include an exact match for skill"""
+    try:
+        with get_db_connection(db_path) as conn:
+            return conn.execute(SQL_SELECT_BY_SKILL, (skill, limit)).fetchall()
+    except Exception as e:
+        logger.error(f"Error searching resumes by skill: {e}")
+        return []
+
 def get_resume_details(resume_id, db_path="history.db"):
     """Get detailed information for a specific resume analysis"""
     try:
         with get_db_connection(db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT * FROM resume_logs WHERE id = ?", (resume_id,))
-            row = c.fetchone()
-
-            if row:
-                columns = [
-                    "id", "timestamp", "name", "skills", "education",
-                    "experience", "match_percent", "job_title", 
-                    "feedback_summary", "suggested_jobs"
-                ]
-                return dict(zip(columns, row))
-            return None
+            row = conn.execute(SQL_SELECT_BY_ID, (resume_id,)).fetchone()
+            return dict(row) if row else None
     except Exception as e:
         logger.error(f"Error retrieving resume details: {e}")
         return None
 
 def log_interaction(agent_name, action, input_data, output_data, db_path="history.db"):
-    """Log agent interactions for debugging and analysis"""
-    try:
-        with get_db_connection(db_path) as conn:
-            c = conn.cursor()
-            c.execute("""
-                INSERT INTO agent_interactions 
-                (timestamp, agent_name, action, input_data, output_data) 
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                datetime.datetime.now().isoformat(),
-                agent_name,
-                action,
-                str(input_data)[:5000],  # Limit input data length
-                str(output_data)[:5000],  # Limit output data length
-            ))
-            conn.commit()
-    except Exception as e:
-        logger.error(f"Error logging interaction: {e}")
+    """Queue an agent interaction for logging; rows are written in batches off the caller's thread"""
+    _ensure_interaction_flusher()
+    _interaction_queue.put((db_path, (
+        datetime.datetime.now().isoformat(),
+        agent_name,
+        action,
+        _truncate(input_data),  # Limit input data length
+        _truncate(output_data),  # Limit output data length
+    )))
+
+def _truncate(value, limit=_LOG_FIELD_LIMIT):
+    """Return the first limit characters of str(value) without formatting large containers in full"""
+    if isinstance(value, str):
+        return value[:limit]
+    if type(value) in (dict, list, tuple):
+        parts = []
+        remaining = limit
+        for chunk in _repr_chunks(value, limit, set()):
+            parts.append(chunk[:remaining])
+            remaining -= len(chunk)
+            if remaining <= 0:
+                break
+        return "".join(parts)
+    return str(value)[:limit]
+
+def _repr_chunks(value, limit, active):
+    """Yield repr(value) piece by piece so the caller can stop once it has enough"""
+    value_type = type(value)
+    if value_type in (dict, list, tuple):
+        # Self-referencing containers print as {...} / [...] like the built-in repr
+        if id(value) in active:
+            yield "{...}" if value_type is dict else "[...]" if value_type is list else "(...)"
+            return
+        active.add(id(value))
+        if value_type is dict:
+            yield "{"
+            for i, (key, item) in enumerate(value.items()):
+                if i:
+                    yield ", "
+                yield from _repr_chunks(key, limit, active)
+                yield ": "
+                yield from _repr_chunks(item, limit, active)
+            yield "}"
+        else:
+            yield "[" if value_type is list else "("
+            for i, item in enumerate(value):
+                if i:
+                    yield ", "
+                yield from _repr_chunks(item, limit, active)
+            if value_type is tuple and len(value) == 1:
+                yield ","
+            yield "]" if value_type is list else ")"
+        active.discard(id(value))
+    elif value_type is str and len(value) > limit:
+        # The quote character repr picks depends on the whole string; only use
+        # the prefix's repr when it agrees, otherwise format the string in full
+        head = repr(value[:limit])
+        quote = '"' if "'" in value and '"' not in value else "'"
+        yield head if head[0] == quote else repr(value)
+    else:
+        yield repr(value)
+
+def flush_interactions():
+    """Write every queued interaction now; also runs at interpreter exit"""
+    while True:
+        batch = _drain_interactions()
+        if not batch:
+            break
+        _write_interactions(batch)
+
+def _drain_interactions(first=None):
+    """Pop up to _INTERACTION_BATCH_SIZE queued interactions without blocking"""
+    batch = [] if first is None else [first]
+    while len(batch) < _INTERACTION_BATCH_SIZE:
+        try:
+            batch.append(_interaction_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+def _write_interactions(batch):
+    """Insert a batch of (db_path, row) pairs, one transaction per database"""
+    rows_by_db = {}
+    for db_path, row in batch:
+        rows_by_db.setdefault(db_path, []).append(row)
+    
+    for db_path, rows in rows_by_db.items():
+        try:
+            with _write_lock, get_db_connection(db_path) as conn:
+                conn.executemany(SQL_INSERT_INTERACTION, rows)
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error logging interaction: {e}")
+
+def _interaction_flusher():
+    """Background loop: wait for an interaction, then write it with whatever else is queued"""
+    while True:
+        _write_interactions(_drain_interactions(_interaction_queue.get()))
+
+def _ensure_interaction_flusher():
+    """Start the flusher thread on first use"""
+    global _flusher_thread
+    if _flusher_thread is not None:
+        return
+    with _flusher_lock:
+        if _flusher_thread is None:
+            _flusher_thread = threading.Thread(
+                target=_interaction_flusher, name="interaction-flusher", daemon=True
+            )
+            _flusher_thread.start()
+            atexit.register(flush_interactions)
 
 class SQLiteLogger:
     """SQLiteLogger class to provide compatibility with existing app.py imports"""
@@ -166,25 +371,40 @@ class SQLiteLogger:
     def log_analysis(self, analysis_data, filename):
         """Log resume analysis data"""
         try:
-            parsed_data = analysis_data.get("parsed_data", {}) if analysis_data else {}
-            
-            match_result = {
-                "match_percent": analysis_data.get("overall_score", 0) if analysis_data else 0,
-                "job_title": analysis_data.get("target_job", "") if analysis_data else "",
-                "feedback_summary": ", ".join(analysis_data.get("recommendations", [])) if analysis_data else "",
-                "job_roles": analysis_data.get("job_suggestions", []) if analysis_data else [],
-            }
-
-            save_to_db(parsed_data, match_result, self.db_path)
+            save_to_db(*self._analysis_record(analysis_data), self.db_path)
             logger.info(f"Analysis logged for file: {filename}")
 
         except Exception as e:
             logger.error(f"Error in log_analysis: {e}")
 
+    def log_batch(self, analyses):
+        """Log several resume analyses in one transaction"""
+        try:
+            save_many_to_db([self._analysis_record(data) for data in analyses], self.db_path)
+        except Exception as e:
+            logger.error(f"Error in log_batch: {e}")
+
+    @staticmethod
+    def _analysis_record(analysis_data):
+        """Map an analysis result to the (parsed_data, match_result) pair save_to_db expects"""
+        parsed_data = analysis_data.get("parsed_data", {}) if analysis_data else {}
+        
+        match_result = {
+            "match_percent": analysis_data.get("overall_score", 0) if analysis_data else 0,
+            "job_title": analysis_data.get("target_job", "") if analysis_data else "",
+            "feedback_summary": ", ".join(analysis_data.get("recommendations", [])) if analysis_data else "",
+            "job_roles": analysis_data.get("job_suggestions", []) if analysis_data else [],
+        }
+        return parsed_data, match_result
+
     def get_history(self, limit=10):
         """Get analysis history"""
         return get_history(limit, self.db_path)
 
+    def get_history_summary(self, limit=10):
+        """Get analysis history summary columns"""
+        return get_history_summary(limit, self.db_path)
+
     def get_resume_details(self, resume_id):
         """Get specific resume details"""
         return get_resume_details(resume_id, self.db_path)
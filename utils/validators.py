@@ -0,0 +1,100 @@
+import os
+import re
+
+ALLOWED_RESUME_EXTENSIONS = frozenset({"pdf"})
+MAX_RESUME_SIZE = 10 * 1024 * 1024  # 10 MB
+
+
+def validate_api_keys(gemini_key=None, mistral_key=None):
+    """
+    Checks the format of AI provider API keys.
+
+    Args:
+        gemini_key (str, optional): Google Gemini API key
+        mistral_key (str, optional): Mistral AI API key
+
+    Returns:
+        dict: ``gemini_valid`` and ``mistral_valid`` flags; a key that was
+        not supplied is reported as invalid
+    """
+    from utils.config import GEMINI_KEY_RULE, MISTRAL_KEY_RULE, _is_valid_key
+
+    return {
+        "gemini_valid": _is_valid_key(gemini_key, **GEMINI_KEY_RULE),
+        "mistral_valid": _is_valid_key(mistral_key, **MISTRAL_KEY_RULE),
+    }
+
+
+class EmailValidator:
+    """Validation helpers for the SMTP email configuration"""
+
+    _EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$")
+    MIN_PASSWORD_LENGTH = 8
+
+    @staticmethod
+    def validate_email_config(email, password):
+        """
+        Validates a sender address and password pair.
+
+        Args:
+            email (str): Sender email address
+            password (str): SMTP or app password
+
+        Returns:
+            dict: ``valid`` flag and a list of ``errors``
+        """
+        errors = []
+
+        if not email or not EmailValidator._EMAIL_RE.match(email.strip()):
+            errors.append("Invalid email address format")
+
+        # Gmail app passwords are displayed in groups separated by spaces
+        if not password or len(password.replace(" ", "")) < EmailValidator.MIN_PASSWORD_LENGTH:
+            errors.append(
+                f"Password must be at least {EmailValidator.MIN_PASSWORD_LENGTH} characters"
+            )
+
+        return {"valid": not errors, "errors": errors}
+
+
+def validate_resume_upload(source, filename=None):
+    """
+    Validates an uploaded resume, either on disk or in memory.
+
+    Args:
+        source (str | bytes): Path to the uploaded file, or its raw bytes
+        filename (str, optional): Original file name; required with bytes
+            to determine the extension
+
+    Returns:
+        dict: ``valid`` flag, a list of ``errors`` and ``file_info`` with
+        the file ``size`` in bytes and its ``extension``
+    """
+    errors = []
+
+    if isinstance(source, bytes):
+        exists = True
+        size = len(source)
+        name = filename or ""
+    else:
+        exists = os.path.exists(source)
+        size = os.path.getsize(source) if exists else 0
+        name = filename or source
+
+    extension = os.path.splitext(name)[1].lstrip(".").lower()
+
+    if not exists:
+        errors.append("File not found")
+    elif size == 0:
+        errors.append("File is empty")
+    elif size > MAX_RESUME_SIZE:
+        errors.append(f"File is too large (max {MAX_RESUME_SIZE // (1024 * 1024)} MB)")
+
+    if extension not in ALLOWED_RESUME_EXTENSIONS:
+        errors.append(f"Unsupported file type: .{extension or '?'} (PDF required)")
+
+    return {
+        "valid": not errors,
+        "errors": errors,
+        "file_info": {"size": size, "extension": extension},
+    }